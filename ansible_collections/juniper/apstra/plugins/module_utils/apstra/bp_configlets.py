@@ -21,6 +21,7 @@ Usage inside a module::
 
     from ansible_collections.juniper.apstra.plugins.module_utils.apstra.bp_configlets import (
         list_blueprint_configlets,
+        index_blueprint_configlets_by_label,
         get_blueprint_configlet,
         create_blueprint_configlet,
         update_blueprint_configlet,
@@ -33,31 +34,69 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import copy
+from urllib.parse import quote
+
+from ansible_collections.juniper.apstra.plugins.module_utils.apstra.client import (
+    decode_json,
+)
+
+# Keys for the configlet list and its label index in the client
+# factory's per-run cache
+_CACHE_KEY = "configlets"
+_INDEX_KEY = "configlets_by_label"
+
+
+def _invalidate(client_factory, blueprint_id):
+    """Drop the cached configlet list and label index after a write."""
+    client_factory.invalidate_blueprint_cache(blueprint_id, _CACHE_KEY)
+    client_factory.invalidate_blueprint_cache(blueprint_id, _INDEX_KEY)
+
+
+def _configlets_path(blueprint_id, configlet_id=None):
+    """Return the configlets collection path, or one configlet's path."""
+    path = f"/blueprints/{blueprint_id}/configlets"
+    if configlet_id is None:
+        return path
+    return f"{path}/{configlet_id}"
+
 
 # ──────────────────────────────────────────────────────────────────
 #  Collection operations
 # ──────────────────────────────────────────────────────────────────
 
 
-def list_blueprint_configlets(client_factory, blueprint_id):
+def list_blueprint_configlets(client_factory, blueprint_id, use_cache=True):
     """List all configlets in a blueprint.
 
     Calls ``GET /api/blueprints/{bp_id}/configlets`` via
-    ``raw_request``.
+    ``raw_request``.  The result is cached on the client factory for
+    the rest of the module run; the create, update and delete helpers
+    below invalidate it.
 
     Args:
         client_factory: An ``ApstraClientFactory`` instance.
         blueprint_id: The blueprint UUID.
+        use_cache: Return the cached list when available (default
+            *True*).  Pass *False* to force a fresh GET.
 
     Returns:
         list[dict]: List of configlet dicts.  Returns empty list on
         error or when no configlets exist.
     """
+    if use_cache:
+        cached = client_factory.get_blueprint_cache(blueprint_id, _CACHE_KEY)
+        if cached is not None:
+            return list(cached)
     base = client_factory.get_base_client()
-    resp = base.raw_request(f"/blueprints/{blueprint_id}/configlets")
+    resp = base.raw_request(_configlets_path(blueprint_id))
     if resp.status_code == 200:
-        data = resp.json()
-        return data.get("items", [])
+        # Configlet lists carry every generator's template_text, so
+        # decode with orjson when it is available
+        data = decode_json(resp)
+        items = data.get("items", [])
+        client_factory.set_blueprint_cache(blueprint_id, _CACHE_KEY, items)
+        return list(items)
     return []
 
 
@@ -81,9 +120,9 @@ def get_blueprint_configlet(client_factory, blueprint_id, configlet_id):
         dict or None: The configlet dict, or *None* if not found.
     """
     base = client_factory.get_base_client()
-    resp = base.raw_request(f"/blueprints/{blueprint_id}/configlets/{configlet_id}")
+    resp = base.raw_request(_configlets_path(blueprint_id, configlet_id))
     if resp.status_code == 200:
-        return resp.json()
+        return decode_json(resp)
     return None
 
 
@@ -105,9 +144,10 @@ def create_blueprint_configlet(client_factory, blueprint_id, body):
         Exception: If creation fails.
     """
     base = client_factory.get_base_client()
-    resp = base.raw_request(f"/blueprints/{blueprint_id}/configlets", "POST", data=body)
+    resp = base.raw_request(_configlets_path(blueprint_id), "POST", data=body)
+    _invalidate(client_factory, blueprint_id)
     if resp.status_code in (200, 201):
-        return resp.json()
+        return decode_json(resp)
     raise Exception(
         f"Failed to create blueprint configlet: {resp.status_code} {resp.text}"
     )
@@ -130,8 +170,9 @@ def update_blueprint_configlet(client_factory, blueprint_id, configlet_id, body)
     """
     base = client_factory.get_base_client()
     resp = base.raw_request(
-        f"/blueprints/{blueprint_id}/configlets/{configlet_id}", "PUT", data=body
+        _configlets_path(blueprint_id, configlet_id), "PUT", data=body
     )
+    _invalidate(client_factory, blueprint_id)
     if resp.status_code not in (200, 202, 204):
         raise Exception(
             f"Failed to update blueprint configlet: {resp.status_code} {resp.text}"
@@ -154,9 +195,8 @@ def delete_blueprint_configlet(client_factory, blueprint_id, configlet_id):
         Exception: If deletion fails.
     """
     base = client_factory.get_base_client()
-    resp = base.raw_request(
-        f"/blueprints/{blueprint_id}/configlets/{configlet_id}", "DELETE"
-    )
+    resp = base.raw_request(_configlets_path(blueprint_id, configlet_id), "DELETE")
+    _invalidate(client_factory, blueprint_id)
     if resp.status_code not in (200, 202, 204):
         raise Exception(
             f"Failed to delete blueprint configlet: {resp.status_code} {resp.text}"
@@ -168,10 +208,56 @@ def delete_blueprint_configlet(client_factory, blueprint_id, configlet_id):
 # ──────────────────────────────────────────────────────────────────
 
 
+def _label_index(client_factory, blueprint_id, fetch=True):
+    """Return the cached ``{label: configlet}`` index (not a copy).
+
+    Built from the cached configlet list, or from a fresh list when
+    *fetch* is true.  Returns *None* when neither is available.
+    """
+    index = client_factory.get_blueprint_cache(blueprint_id, _INDEX_KEY)
+    if index is not None:
+        return index
+    items = client_factory.get_blueprint_cache(blueprint_id, _CACHE_KEY)
+    if items is None:
+        if not fetch:
+            return None
+        items = list_blueprint_configlets(client_factory, blueprint_id)
+    index = {}
+    for item in items:
+        if isinstance(item, dict) and item.get("label"):
+            # First configlet wins, matching a linear scan
+            index.setdefault(item["label"], item)
+    client_factory.set_blueprint_cache(blueprint_id, _INDEX_KEY, index)
+    return index
+
+
+def index_blueprint_configlets_by_label(client_factory, blueprint_id):
+    """Map every configlet label in a blueprint to its configlet.
+
+    Built once per module run from the (cached) configlet list, so
+    resolving many labels costs one GET and one O(1) lookup each.
+
+    Args:
+        client_factory: An ``ApstraClientFactory`` instance.
+        blueprint_id: The blueprint UUID.
+
+    Returns:
+        dict: ``{label: configlet_dict}``.
+    """
+    return copy.deepcopy(_label_index(client_factory, blueprint_id))
+
+
 def find_blueprint_configlet_by_label(client_factory, blueprint_id, label):
     """Find a blueprint configlet by its label.
 
-    Iterates the configlet list and returns the first match.
+    When the configlet list is already cached for this run, the label
+    is looked up in its index and no request is made.  Otherwise asks
+    the server to filter by label
+    (``GET /api/blueprints/{bp_id}/configlets?label=...``) so only the
+    matching configlets are transferred, and falls back to the label
+    index of the full list when the filter is rejected.  A server that
+    ignores the filter returns the full list, which is cached and
+    indexed the same way.
 
     Args:
         client_factory: An ``ApstraClientFactory`` instance.
@@ -181,8 +267,32 @@ def find_blueprint_configlet_by_label(client_factory, blueprint_id, label):
     Returns:
         dict or None: The matching configlet dict, or *None*.
     """
-    items = list_blueprint_configlets(client_factory, blueprint_id)
-    for item in items:
-        if isinstance(item, dict) and item.get("label") == label:
-            return item
-    return None
+    index = _label_index(client_factory, blueprint_id, fetch=False)
+    if index is not None:
+        item = index.get(label)
+        return copy.deepcopy(item) if item is not None else None
+
+    base = client_factory.get_base_client()
+    resp = base.raw_request(
+        f"{_configlets_path(blueprint_id)}?label={quote(label, safe='')}"
+    )
+    if resp.status_code != 200:
+        # Filter rejected: the full list is fetched (and cached) anyway,
+        # so resolve through its label index for later lookups too
+        item = _label_index(client_factory, blueprint_id).get(label)
+        return copy.deepcopy(item) if item is not None else None
+    items = decode_json(resp).get("items", [])
+    if any(isinstance(item, dict) and item.get("label") != label for item in items):
+        # Filter ignored: this is the full list, so cache it like the
+        # fallback path and resolve through its label index
+        client_factory.set_blueprint_cache(blueprint_id, _CACHE_KEY, items)
+        item = _label_index(client_factory, blueprint_id).get(label)
+        return copy.deepcopy(item) if item is not None else None
+    return next(
+        (
+            item
+            for item in items
+            if isinstance(item, dict) and item.get("label") == label
+        ),
+        None,
+    )
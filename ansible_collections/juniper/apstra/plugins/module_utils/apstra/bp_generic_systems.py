@@ -34,42 +34,61 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+from ansible_collections.juniper.apstra.plugins.module_utils.apstra.client import (
+    decode_json,
+)
+
 
 # ──────────────────────────────────────────────────────────────────
 #  Internal raw-request helpers
 # ──────────────────────────────────────────────────────────────────
 
 
-def _raw_post(client_factory, path, data, ok_codes=(200, 201, 202)):
+# Accepted status codes per method, built once at import time.
+_OK_POST = frozenset((200, 201, 202))
+_OK_CHANGE = frozenset((200, 202, 204))
+
+
+def _raw_request(
+    client_factory, method, path, data=None, ok_codes=_OK_CHANGE, parse=True
+):
+    """Issue a request via raw_request and check the status.  Internal helper.
+
+    Returns the decoded JSON body (``{}`` when the body is empty or not
+    JSON), or *None* for ``DELETE`` or when *parse* is false (callers
+    that ignore the response skip the JSON decode).  Raises on any
+    status outside *ok_codes*.
+    """
+    raw_request = client_factory.get_base_client().raw_request
+    if data is None:
+        resp = raw_request(path, method)
+    else:
+        resp = raw_request(path, method, data=data)
+    if resp.status_code not in ok_codes:
+        raise Exception(f"{method} {path} failed: {resp.status_code} {resp.text}")
+    if not parse or method == "DELETE":
+        return None
+    try:
+        return decode_json(resp)
+    except ValueError:
+        # Empty or non-JSON body (json, requests and orjson decode
+        # errors all subclass ValueError)
+        return {}
+
+
+def _raw_post(client_factory, path, data, ok_codes=_OK_POST):
     """Issue a POST via raw_request.  Internal helper."""
-    base = client_factory.get_base_client()
-    resp = base.raw_request(path, "POST", data=data)
-    if resp.status_code in ok_codes:
-        try:
-            return resp.json()
-        except Exception:
-            return {}
-    raise Exception(f"POST {path} failed: {resp.status_code} {resp.text}")
+    return _raw_request(client_factory, "POST", path, data, ok_codes)
 
 
-def _raw_delete(client_factory, path, ok_codes=(200, 202, 204)):
+def _raw_delete(client_factory, path, ok_codes=_OK_CHANGE):
     """Issue a DELETE via raw_request.  Internal helper."""
-    base = client_factory.get_base_client()
-    resp = base.raw_request(path, "DELETE")
-    if resp.status_code not in ok_codes:
-        raise Exception(f"DELETE {path} failed: {resp.status_code} {resp.text}")
+    _raw_request(client_factory, "DELETE", path, ok_codes=ok_codes)
 
 
-def _raw_patch(client_factory, path, data, ok_codes=(200, 202, 204)):
+def _raw_patch(client_factory, path, data, ok_codes=_OK_CHANGE, parse=True):
     """Issue a PATCH via raw_request.  Internal helper."""
-    base = client_factory.get_base_client()
-    resp = base.raw_request(path, "PATCH", data=data)
-    if resp.status_code in ok_codes:
-        try:
-            return resp.json()
-        except Exception:
-            return {}
-    raise Exception(f"PATCH {path} failed: {resp.status_code} {resp.text}")
+    return _raw_request(client_factory, "PATCH", path, data, ok_codes, parse)
 
 
 # ──────────────────────────────────────────────────────────────────
@@ -77,6 +96,65 @@ def _raw_patch(client_factory, path, data, ok_codes=(200, 202, 204)):
 # ──────────────────────────────────────────────────────────────────
 
 
+# Fixed parts of the logical device generated for a new generic system.
+# They are only serialized, never mutated, so every payload shares them.
+_LD_SPEED = {"value": 10, "unit": "G"}
+_LD_PORT_ROLES = ("leaf", "access")
+_LD_PORT_INDEXING = {"schema": "absolute", "order": "T-B, L-R", "start_index": 1}
+
+
+def _logical_device(link_count):
+    """Build the single-panel logical device for a *link_count*-port system."""
+    ld_id = f"AOS-{link_count}x{_LD_SPEED['value']}-1"
+    return {
+        "id": ld_id,
+        "display_name": ld_id,
+        "panels": [
+            {
+                "port_groups": [
+                    {
+                        "roles": list(_LD_PORT_ROLES),
+                        "count": link_count,
+                        "speed": _LD_SPEED,
+                    }
+                ],
+                "port_indexing": _LD_PORT_INDEXING,
+                "panel_layout": {"row_count": 1, "column_count": link_count},
+            }
+        ],
+    }
+
+
+def _make_api_link(link, sys_id, new_system_index=None):
+    """Shape one module link dict into a switch-system-links entry.
+
+    Args:
+        link: A link definition dict from the module parameters.
+        sys_id: The existing system node ID, or *None* for a new system.
+        new_system_index: Index into ``new_systems`` when creating a
+            new system; omitted from the entry when *None*.
+
+    Returns:
+        dict: The API link entry.
+    """
+    get = link.get
+    api_link = {
+        "switch": {
+            "system_id": link["target_switch_id"],
+            "transformation_id": get("target_switch_if_transform_id", 1),
+            "if_name": link["target_switch_if_name"],
+        },
+        "system": {"system_id": sys_id},
+        "lag_mode": get("lag_mode") or None,
+    }
+    if new_system_index is not None:
+        api_link["new_system_index"] = new_system_index
+    group_label = get("group_label")
+    if group_label:
+        api_link["link_group_label"] = group_label
+    return api_link
+
+
 def create_switch_system_links(
     client_factory,
     blueprint_id,
@@ -105,33 +183,7 @@ def create_switch_system_links(
     Returns:
         dict: The API response (with ``ids`` list of created link IDs).
     """
-    link_count = len(links)
-    speed_value = 10
-    speed_unit = "G"
-
-    api_links = []
-    for link in links:
-        api_link = {
-            "switch": {
-                "system_id": link["target_switch_id"],
-                "transformation_id": link.get("target_switch_if_transform_id", 1),
-                "if_name": link["target_switch_if_name"],
-            },
-            "system": {
-                "system_id": None,
-            },
-            "new_system_index": 0,
-        }
-        if link.get("lag_mode"):
-            api_link["lag_mode"] = link["lag_mode"]
-        else:
-            api_link["lag_mode"] = None
-        if link.get("group_label"):
-            api_link["link_group_label"] = link["group_label"]
-        api_links.append(api_link)
-
-    ld_id = f"AOS-{link_count}x{speed_value}-1"
-    ld_display = ld_id
+    api_links = [_make_api_link(link, None, new_system_index=0) for link in links]
 
     body = {
         "links": api_links,
@@ -141,41 +193,17 @@ def create_switch_system_links(
                 "label": name or hostname or "generic-system",
                 "hostname": hostname or name or "generic-system",
                 "deploy_mode": "deploy",
-                "logical_device": {
-                    "id": ld_id,
-                    "display_name": ld_display,
-                    "panels": [
-                        {
-                            "port_groups": [
-                                {
-                                    "roles": ["leaf", "access"],
-                                    "count": link_count,
-                                    "speed": {
-                                        "value": speed_value,
-                                        "unit": speed_unit,
-                                    },
-                                }
-                            ],
-                            "port_indexing": {
-                                "schema": "absolute",
-                                "order": "T-B, L-R",
-                                "start_index": 1,
-                            },
-                            "panel_layout": {
-                                "row_count": 1,
-                                "column_count": link_count,
-                            },
-                        }
-                    ],
-                },
+                "logical_device": _logical_device(len(links)),
                 "port_channel_id_min": port_channel_id_min or 0,
                 "port_channel_id_max": port_channel_id_max or 0,
             }
         ],
     }
-    return _raw_post(
+    result = _raw_post(
         client_factory, f"/blueprints/{blueprint_id}/switch-system-links", body
     )
+    client_factory.invalidate_blueprint_cache(blueprint_id)
+    return result
 
 
 def add_links_to_system(client_factory, blueprint_id, sys_id, links):
@@ -193,30 +221,12 @@ def add_links_to_system(client_factory, blueprint_id, sys_id, links):
     Returns:
         dict: The API response.
     """
-    api_links = []
-    for link in links:
-        api_link = {
-            "switch": {
-                "system_id": link["target_switch_id"],
-                "transformation_id": link.get("target_switch_if_transform_id", 1),
-                "if_name": link["target_switch_if_name"],
-            },
-            "system": {
-                "system_id": sys_id,
-            },
-        }
-        if link.get("lag_mode"):
-            api_link["lag_mode"] = link["lag_mode"]
-        else:
-            api_link["lag_mode"] = None
-        if link.get("group_label"):
-            api_link["link_group_label"] = link["group_label"]
-        api_links.append(api_link)
-
-    body = {"links": api_links}
-    return _raw_post(
+    body = {"links": [_make_api_link(link, sys_id) for link in links]}
+    result = _raw_post(
         client_factory, f"/blueprints/{blueprint_id}/switch-system-links", body
     )
+    client_factory.invalidate_blueprint_cache(blueprint_id)
+    return result
 
 
 def delete_switch_system_links(client_factory, blueprint_id, link_ids):
@@ -225,7 +235,8 @@ def delete_switch_system_links(client_factory, blueprint_id, link_ids):
     Calls ``POST /api/blueprints/{bp}/delete-switch-system-links``
     via ``raw_request`` — no SDK support.
 
-    Removing the last link removes the generic system itself.
+    Removing the last link removes the generic system itself.  All
+    links go in one request, so the deletion is all-or-nothing.
 
     Args:
         client_factory: An ``ApstraClientFactory`` instance.
@@ -241,6 +252,7 @@ def delete_switch_system_links(client_factory, blueprint_id, link_ids):
         "POST",
         data={"link_ids": link_ids},
     )
+    client_factory.invalidate_blueprint_cache(blueprint_id)
     if resp.status_code not in (200, 201, 202, 204):
         raise Exception(
             f"Failed to delete switch-system-links: {resp.status_code} {resp.text}"
@@ -271,9 +283,11 @@ def create_external_generic_system(client_factory, blueprint_id, name, hostname)
         "label": name or hostname or "external-generic-system",
         "hostname": hostname or name or "external-generic-system",
     }
-    return _raw_post(
+    result = _raw_post(
         client_factory, f"/blueprints/{blueprint_id}/external-generic-systems", body
     )
+    client_factory.invalidate_blueprint_cache(blueprint_id)
+    return result
 
 
 def delete_external_generic_system(client_factory, blueprint_id, sys_id):
@@ -294,6 +308,7 @@ def delete_external_generic_system(client_factory, blueprint_id, sys_id):
         client_factory,
         f"/blueprints/{blueprint_id}/external-generic-systems/{sys_id}",
     )
+    client_factory.invalidate_blueprint_cache(blueprint_id)
 
 
 # ──────────────────────────────────────────────────────────────────
@@ -395,7 +410,8 @@ def set_system_asn(client_factory, blueprint_id, sys_id, asn):
             }
         },
     }
-    _raw_patch(client_factory, f"/blueprints/{blueprint_id}", body)
+    _raw_patch(client_factory, f"/blueprints/{blueprint_id}", body, parse=False)
+    client_factory.invalidate_blueprint_cache(blueprint_id)
 
 
 def get_system_loopback(client_factory, blueprint_id, sys_id):
@@ -497,5 +513,6 @@ def create_or_update_loopback(
                 }
             },
         }
-        _raw_patch(client_factory, f"/blueprints/{blueprint_id}", body)
+        _raw_patch(client_factory, f"/blueprints/{blueprint_id}", body, parse=False)
+        client_factory.invalidate_blueprint_cache(blueprint_id)
         return lo_node_id
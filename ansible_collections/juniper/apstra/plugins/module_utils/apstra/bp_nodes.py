@@ -40,6 +40,11 @@ __metaclass__ = type
 # Fields that the Apstra API allows patching without allow_unsafe=true
 _SAFE_PATCH_FIELDS = frozenset({"label", "deploy_mode", "system_id", "hostname"})
 
+# Key template for single nodes in the client factory's per-run cache
+_NODE_CACHE_KEY = "node:{}"
+# Key for the full node map in the same cache
+_NODES_CACHE_KEY = "nodes"
+
 
 def _get_blueprint(client_factory, blueprint_id):
     """Return the SDK blueprint accessor ``client.blueprints[bp_id]``."""
@@ -52,36 +57,65 @@ def _get_blueprint(client_factory, blueprint_id):
 # ──────────────────────────────────────────────────────────────────
 
 
-def get_node(client_factory, blueprint_id, node_id):
+def get_node(client_factory, blueprint_id, node_id, use_cache=True):
     """Read a single blueprint node via the SDK.
 
-    Uses ``client.blueprints[bp_id].nodes[node_id].get()``.
+    Uses ``client.blueprints[bp_id].nodes[node_id].get()``.  Found
+    nodes are cached on the client factory for the rest of the module
+    run; the write helpers in this module (and the generic-system
+    mutation helpers) invalidate them.
 
     Args:
         client_factory: An ``ApstraClientFactory`` instance.
         blueprint_id: The blueprint UUID.
         node_id: The node UUID within the blueprint.
+        use_cache: Return the cached node when available (default
+            *True*).  Pass *False* to force a fresh GET.
 
     Returns:
         dict or None: The node properties dict, or *None* if not found.
     """
+    key = _NODE_CACHE_KEY.format(node_id)
+    if use_cache:
+        cached = client_factory.get_blueprint_cache(blueprint_id, key)
+        if cached is not None:
+            return dict(cached)
     bp = _get_blueprint(client_factory, blueprint_id)
-    return bp.nodes[node_id].get()
+    node = bp.nodes[node_id].get()
+    if node:
+        client_factory.set_blueprint_cache(blueprint_id, key, node)
+        return dict(node)
+    return node
 
 
-def list_nodes(client_factory, blueprint_id):
+def list_nodes(client_factory, blueprint_id, use_cache=True):
     """List all blueprint nodes via the SDK.
 
     Uses ``client.blueprints[bp_id].nodes.list()``  which returns
-    the ``nodes`` dict directly (keyed by node ID).
+    the ``nodes`` dict directly (keyed by node ID).  The result is
+    cached on the client factory for the rest of the module run; the
+    write helpers in this module invalidate it.
+
+    Args:
+        client_factory: An ``ApstraClientFactory`` instance.
+        blueprint_id: The blueprint UUID.
+        use_cache: Return the cached map when available (default
+            *True*).  Pass *False* to force a fresh GET.
 
     Returns:
         dict: Mapping of ``{node_id: node_dict}``.  Returns empty dict
         on error.
     """
+    if use_cache:
+        cached = client_factory.get_blueprint_cache(blueprint_id, _NODES_CACHE_KEY)
+        if cached is not None:
+            return dict(cached)
     bp = _get_blueprint(client_factory, blueprint_id)
-    result = bp.nodes.list()
-    return result or {}
+    result = bp.nodes.list() or {}
+    if result:
+        client_factory.set_blueprint_cache(blueprint_id, _NODES_CACHE_KEY, result)
+        return dict(result)
+    return result
 
 
 # ──────────────────────────────────────────────────────────────────
@@ -109,13 +143,22 @@ def patch_node(client_factory, blueprint_id, node_id, data):
             - ``external`` -- external flag (requires allow_unsafe)
 
     Returns:
-        dict: The API response (may be empty on 204).
+        dict: The API response (may be empty on 204).  An empty *data*
+        makes no request and returns an empty dict.
     """
-    unsafe_fields = set(data.keys()) - _SAFE_PATCH_FIELDS
-    allow_unsafe = bool(unsafe_fields)
+    if not data:
+        return {}
+    # One pass over the payload keys, no intermediate set
+    allow_unsafe = not _SAFE_PATCH_FIELDS.issuperset(data)
 
     bp = _get_blueprint(client_factory, blueprint_id)
-    return bp.nodes[node_id].update(data, allow_unsafe=allow_unsafe)
+    try:
+        return bp.nodes[node_id].update(data, allow_unsafe=allow_unsafe)
+    finally:
+        client_factory.invalidate_blueprint_cache(
+            blueprint_id, _NODE_CACHE_KEY.format(node_id)
+        )
+        client_factory.invalidate_blueprint_cache(blueprint_id, _NODES_CACHE_KEY)
 
 
 def patch_nodes_bulk(client_factory, blueprint_id, data):
@@ -132,7 +175,50 @@ def patch_nodes_bulk(client_factory, blueprint_id, data):
         dict: The API response.
     """
     bp = _get_blueprint(client_factory, blueprint_id)
-    return bp.nodes.update(data, allow_unsafe=True)
+    try:
+        return bp.nodes.update(data, allow_unsafe=True)
+    finally:
+        client_factory.invalidate_blueprint_cache(blueprint_id)
+
+
+def patch_nodes_bulk_safe(client_factory, blueprint_id, updates):
+    """Apply per-node patches with at most two bulk node updates.
+
+    Nodes whose patch only touches ``_SAFE_PATCH_FIELDS`` are sent in
+    one ``nodes.update(..., allow_unsafe=False)`` call; the rest in one
+    ``allow_unsafe=True`` call.  Replaces a ``patch_node`` loop (one
+    round trip per node) for callers that update many nodes.
+
+    Args:
+        client_factory: ``ApstraClientFactory``.
+        blueprint_id: Blueprint UUID.
+        updates: Dict mapping node ID to its dict of fields to patch.
+            Nodes with an empty patch are skipped.
+
+    Returns:
+        list: The API responses, one per bulk call made (empty when
+        there was nothing to patch).
+    """
+    safe, unsafe = {}, {}
+    for node_id, data in updates.items():
+        if not data:
+            continue
+        if _SAFE_PATCH_FIELDS.issuperset(data):
+            safe[node_id] = data
+        else:
+            unsafe[node_id] = data
+
+    responses = []
+    if not safe and not unsafe:
+        return responses
+    bp = _get_blueprint(client_factory, blueprint_id)
+    try:
+        for batch, allow_unsafe in ((safe, False), (unsafe, True)):
+            if batch:
+                responses.append(bp.nodes.update(batch, allow_unsafe=allow_unsafe))
+    finally:
+        client_factory.invalidate_blueprint_cache(blueprint_id)
+    return responses
 
 
 # ──────────────────────────────────────────────────────────────────
@@ -140,7 +226,9 @@ def patch_nodes_bulk(client_factory, blueprint_id, data):
 # ──────────────────────────────────────────────────────────────────
 
 
-def assign_system_id(client_factory, blueprint_id, node_id, system_id):
+def assign_system_id(
+    client_factory, blueprint_id, node_id, system_id, current_node=None
+):
     """Assign a physical device serial number to a blueprint node.
 
     This is the primary operation for binding a real device to a
@@ -151,21 +239,24 @@ def assign_system_id(client_factory, blueprint_id, node_id, system_id):
         blueprint_id: Blueprint UUID.
         node_id: The blueprint node UUID (e.g. from QE query).
         system_id: The device serial number (from system agents).
+        current_node: Optional current node dict.  When given and it
+            already carries *system_id*, no request is made.
 
     Returns:
-        dict: The patch response.
+        dict: The patch response (empty when nothing was patched).
     """
-    return patch_node(
+    return _patch_if_changed(
         client_factory,
         blueprint_id,
         node_id,
-        {
-            "system_id": system_id,
-        },
+        {"system_id": system_id},
+        current_node,
     )
 
 
-def set_deploy_mode(client_factory, blueprint_id, node_id, deploy_mode):
+def set_deploy_mode(
+    client_factory, blueprint_id, node_id, deploy_mode, current_node=None
+):
     """Set the deploy mode on a blueprint node.
 
     Args:
@@ -174,20 +265,28 @@ def set_deploy_mode(client_factory, blueprint_id, node_id, deploy_mode):
         node_id: Node UUID.
         deploy_mode: One of ``"deploy"``, ``"undeploy"``, ``"drain"``,
             ``"ready"``.
+        current_node: Optional current node dict.  When given and it
+            already has *deploy_mode*, no request is made.
 
     Returns:
-        dict: The patch response.
+        dict: The patch response (empty when nothing was patched).
     """
-    return patch_node(
+    return _patch_if_changed(
         client_factory,
         blueprint_id,
         node_id,
-        {
-            "deploy_mode": deploy_mode,
-        },
+        {"deploy_mode": deploy_mode},
+        current_node,
     )
 
 
+def _patch_if_changed(client_factory, blueprint_id, node_id, desired, current_node):
+    """Patch only the *desired* fields that differ from *current_node*."""
+    if current_node is not None:
+        desired = node_needs_update(current_node, desired)
+    return patch_node(client_factory, blueprint_id, node_id, desired)
+
+
 def node_needs_update(current_node, desired):
     """Compare current node state with desired fields.
 
@@ -199,12 +298,8 @@ def node_needs_update(current_node, desired):
         dict: Only the fields that need changing.  Empty dict means
         no update needed.
     """
-    changes = {}
-    for key, value in desired.items():
-        current_value = current_node.get(key)
-        if current_value != value:
-            changes[key] = value
-    return changes
+    get = current_node.get
+    return {key: value for key, value in desired.items() if get(key) != value}
 
 
 def assign_nodes_by_label(client_factory, blueprint_id, assignment, deploy_mode=None):
@@ -212,7 +307,7 @@ def assign_nodes_by_label(client_factory, blueprint_id, assignment, deploy_mode=
 
     Resolves each node label to its UUID, compares current vs desired
     state, and patches only those nodes that actually need updating
-    (idempotent).
+    (idempotent).  All changed nodes are patched in one bulk update.
 
     Args:
         client_factory: ``ApstraClientFactory``.
@@ -242,7 +337,7 @@ def assign_nodes_by_label(client_factory, blueprint_id, assignment, deploy_mode=
         if props.get("label")
     }
 
-    nodes_updated = {}
+    pending = {}
     nodes_unchanged = []
     labels_not_found = []
 
@@ -263,9 +358,27 @@ def assign_nodes_by_label(client_factory, blueprint_id, assignment, deploy_mode=
             nodes_unchanged.append(label)
             continue
 
-        patch_node(client_factory, blueprint_id, node_id, changes)
-        final = get_node(client_factory, blueprint_id, node_id)
-        nodes_updated[label] = final
+        pending[label] = (node_id, changes)
+
+    nodes_updated = {}
+    if pending:
+        # One bulk PATCH instead of a PATCH per node; only the patched
+        # nodes are re-read, concurrently, rather than the whole node map
+        patch_nodes_bulk_safe(
+            client_factory,
+            blueprint_id,
+            {node_id: changes for node_id, changes in pending.values()},
+        )
+        nodes = client_factory.run_concurrently(
+            lambda node_id: get_node(
+                client_factory, blueprint_id, node_id, use_cache=False
+            ),
+            [node_id for node_id, _ in pending.values()],
+        )
+        for node in nodes:
+            if isinstance(node, Exception):
+                raise node
+        nodes_updated = dict(zip(pending, nodes))
 
     return dict(
         changed=bool(nodes_updated),
@@ -34,7 +34,7 @@ __metaclass__ = type
 
 
 def reimport_blueprint_property_set(
-    client_factory, blueprint_id, property_set_id, body
+    client_factory, blueprint_id, property_set_id, body, before=None
 ):
     """Reimport (PUT) a property set into a blueprint.
 
@@ -43,7 +43,9 @@ def reimport_blueprint_property_set(
     ``.update()`` on blueprint property-set resources.
 
     Compares the blueprint property-set values before and after the
-    PUT to determine whether the reimport changed anything.
+    PUT to determine whether the reimport changed anything.  The
+    "after" values come from the PUT response when it includes them,
+    otherwise from a follow-up GET.
 
     Args:
         client_factory: An ``ApstraClientFactory`` instance.
@@ -51,6 +53,8 @@ def reimport_blueprint_property_set(
         property_set_id: The property-set UUID (global PS id used
             as the key inside the blueprint).
         body: The PUT payload, typically ``{"id": "<global_ps_id>"}``.
+        before: Optional blueprint property set already read by the
+            caller.  Used as the "before" snapshot instead of a GET.
 
     Returns:
         dict: ``{"changed": bool, "msg": str}`` indicating whether
@@ -65,9 +69,10 @@ def reimport_blueprint_property_set(
     }
 
     # Snapshot values before reimport
-    before = client_factory.object_request(
-        "blueprints.property_sets", "get", id_for_get
-    )
+    if before is None:
+        before = client_factory.object_request(
+            "blueprints.property_sets", "get", id_for_get
+        )
     before_values = before.get("values") if before else None
 
     # PUT /api/blueprints/{bp_id}/property-sets/{ps_id}
@@ -16,6 +16,8 @@ Usage inside a module::
 
     from ansible_collections.juniper.apstra.plugins.module_utils.apstra.bp_query import (
         run_qe_query,
+        iter_qe_query,
+        run_qe_queries,
         find_nodes_by_role,
         find_interfaces_by_neighbor,
     )
@@ -23,6 +25,11 @@ Usage inside a module::
     items = run_qe_query(client_factory, bp_id,
         "node('system', role='spine', name='system')")
 
+    racks, vns = run_qe_queries(client_factory, bp_id, [
+        "node('rack', name='rack')",
+        "node('virtual_network', name='vn')",
+    ])
+
     nodes = find_nodes_by_role(client_factory, bp_id, ['spine', 'leaf'])
     # => {'spine1': {'id': '...', 'role': 'spine', ...}, ...}
 """
@@ -62,12 +69,70 @@ def _node_to_dict(node):
     return result
 
 
+def qe_quote(value):
+    """Render *value* as a quoted QE string literal.
+
+    QE query strings use Python literal syntax, so ``repr()`` of the
+    string form gives correct quoting and escaping for labels that
+    contain quotes or backslashes.
+    """
+    return repr(str(value))
+
+
+def _qe_is_in(values):
+    """Render an ``is_in([...])`` QE predicate with quoted *values*."""
+    return "is_in([" + ", ".join(qe_quote(v) for v in values) + "])"
+
+
 # ──────────────────────────────────────────────────────────────────
 #  Core QE query
 # ──────────────────────────────────────────────────────────────────
 
 
-def run_qe_query(client_factory, blueprint_id, query_string):
+def iter_qe_query(client_factory, blueprint_id, query_string, params=None):
+    """Run a QE graph query and yield its items one at a time.
+
+    Same query and conversion as ``run_qe_query()``, but each row is
+    converted to plain dicts only when the caller reaches it, so
+    helpers that filter rows never build a converted list of all of
+    them.
+
+    Args:
+        client_factory: An ``ApstraClientFactory`` instance.
+        blueprint_id: The blueprint UUID.
+        query_string: A Python-style graph query string (or template,
+            see ``run_qe_query()``).
+        params: Optional dict of template parameters.
+
+    Yields:
+        dict: ``{alias: node_dict}`` for each result row.  Rows that
+        reference the same graph node share one node dict, so treat
+        the dicts as read-only.
+    """
+    if params:
+        query_string = query_string.format(
+            **{name: qe_quote(value) for name, value in params.items()}
+        )
+    bp = _get_blueprint(client_factory, blueprint_id)
+    # The same node (e.g. a leaf) recurs across many rows; convert each
+    # distinct SDK node once per query and share the resulting dict.
+    seen = {}
+
+    def _convert(node):
+        node_id = getattr(node, "id", None)
+        if node_id is None or isinstance(node, dict):
+            return _node_to_dict(node)
+        converted = seen.get(node_id)
+        if converted is None:
+            converted = seen[node_id] = _node_to_dict(node)
+        return converted
+
+    for raw_item in bp.query(query_string) or ():
+        # Convert SDK Node objects to plain dicts
+        yield {alias: _convert(node) for alias, node in raw_item.items()}
+
+
+def run_qe_query(client_factory, blueprint_id, query_string, params=None):
     """Run a QE graph query and return the items list.
 
     Uses the native SDK ``blueprints[bp_id].query()`` method which
@@ -81,32 +146,87 @@ def run_qe_query(client_factory, blueprint_id, query_string):
         client_factory: An ``ApstraClientFactory`` instance.
         blueprint_id: The blueprint UUID.
         query_string: A Python-style graph query string, e.g.
-            ``"node('system', role='spine', name='s')"``
+            ``"node('system', role='spine', name='s')"``.  When
+            *params* is given, this is a template whose ``{name}``
+            placeholders are replaced by the quoted parameter values.
+        params: Optional dict of template parameters.  Each value is
+            rendered with ``qe_quote()``, so callers never build quoted
+            literals by hand.
 
     Returns:
         list[dict]: Each item is a dict whose keys are the ``name=``
         aliases from the query, and whose values are plain dicts with
-        ``id`` and all node properties.
+        ``id`` and all node properties.  A node that appears in
+        several items is the same (read-only) dict in each.
     """
-    bp = _get_blueprint(client_factory, blueprint_id)
-    raw_items = bp.query(query_string)
-    if not raw_items:
-        return []
+    return list(iter_qe_query(client_factory, blueprint_id, query_string, params))
+
+
+def run_qe_queries(client_factory, blueprint_id, queries, max_workers=None):
+    """Run several independent QE queries concurrently.
 
-    # Convert SDK Node objects to plain dicts
-    items = []
-    for raw_item in raw_items:
-        item = {}
-        for alias, node in raw_item.items():
-            item[alias] = _node_to_dict(node)
-        items.append(item)
-    return items
+    Each query is sent by ``run_qe_query()`` on the client factory's
+    thread pool (``run_concurrently``), sharing one pooled HTTP
+    session, so N queries cost about ``ceil(N / max_workers)`` round
+    trips instead of N.
+
+    Args:
+        client_factory: An ``ApstraClientFactory`` instance.
+        blueprint_id: The blueprint UUID.
+        queries: Iterable of query strings, or ``(template, params)``
+            tuples passed through to ``run_qe_query()``.  May also be
+            a dict mapping a caller-chosen name to such a query.
+        max_workers: Optional thread-pool size.  Defaults to the
+            factory's ``run_concurrently`` default.
+
+    Returns:
+        list[list[dict]] or dict: One items list per query, in input
+        order; or ``{name: items}`` when *queries* is a dict.
+
+    Raises:
+        Exception: The first query failure, after all queries finish.
+    """
+
+    def _run(query):
+        if isinstance(query, tuple):
+            return run_qe_query(client_factory, blueprint_id, *query)
+        return run_qe_query(client_factory, blueprint_id, query)
+
+    names = None
+    if isinstance(queries, dict):
+        names, queries = list(queries), list(queries.values())
+    kwargs = {} if max_workers is None else {"max_workers": max_workers}
+    results = client_factory.run_concurrently(_run, list(queries), **kwargs)
+    for result in results:
+        if isinstance(result, Exception):
+            raise result
+    if names is not None:
+        return dict(zip(names, results))
+    return results
 
 
 # ──────────────────────────────────────────────────────────────────
 #  Higher-level convenience helpers
 # ──────────────────────────────────────────────────────────────────
 
+# Fixed discovery queries.  Templates take pre-rendered predicates
+# (quoted with qe_quote() / _qe_is_in()) as format arguments.
+_QE_ALL_SYSTEMS = "node('system', name='system')"
+_QE_SYSTEMS_BY_ROLE = "node('system', role={roles}, name='system')"
+_QE_SYSTEMS_BY_TYPE = "node('system', system_type={system_type}, name='system')"
+_QE_HOST_BONDS = (
+    "node('system', system_type='server', {label_filter}name='server')"
+    ".out('hosted_interfaces')"
+    ".node('interface', if_type='port_channel', name='intf')"
+)
+_QE_EVPN_PORT_CHANNELS = (
+    "node('interface', if_type='port_channel',"
+    " po_control_protocol='evpn',{desc_filter} name='intf')"
+)
+_QE_REDUNDANCY_GROUPS = (
+    "node('redundancy_group', name='rg').out().node('system', name='mbr')"
+)
+
 
 def find_nodes_by_role(client_factory, blueprint_id, roles=None):
     """Discover system nodes in a blueprint, optionally filtered by role.
@@ -122,20 +242,12 @@ def find_nodes_by_role(client_factory, blueprint_id, roles=None):
         dict: ``{label: {id, role, hostname, system_id, ...}}``
     """
     if roles:
-        roles_str = ", ".join(f"'{r}'" for r in roles)
-        qe = f"node('system', role=is_in([{roles_str}]), name='system')"
+        qe = _QE_SYSTEMS_BY_ROLE.format(roles=_qe_is_in(roles))
     else:
-        qe = "node('system', name='system')"
+        qe = _QE_ALL_SYSTEMS
 
     items = run_qe_query(client_factory, blueprint_id, qe)
-
-    result = {}
-    for item in items:
-        node = item.get("system", {})
-        label = node.get("label")
-        if label:
-            result[label] = node
-    return result
+    return _systems_by_label(items)
 
 
 def find_nodes_by_type(client_factory, blueprint_id, system_type):
@@ -144,16 +256,15 @@ def find_nodes_by_type(client_factory, blueprint_id, system_type):
     Returns:
         dict: ``{label: {id, role, hostname, system_type, ...}}``
     """
-    qe = f"node('system', system_type='{system_type}', name='system')"
+    qe = _QE_SYSTEMS_BY_TYPE.format(system_type=qe_quote(system_type))
     items = run_qe_query(client_factory, blueprint_id, qe)
+    return _systems_by_label(items)
 
-    result = {}
-    for item in items:
-        node = item.get("system", {})
-        label = node.get("label")
-        if label:
-            result[label] = node
-    return result
+
+def _systems_by_label(items):
+    """Map label to system node for ``name='system'`` rows, skipping unlabelled."""
+    nodes = (item.get("system") or {} for item in items)
+    return {node["label"]: node for node in nodes if node.get("label")}
 
 
 def find_interfaces_by_neighbor(
@@ -183,6 +294,10 @@ def find_interfaces_by_neighbor(
         list[dict]: Each dict has ``intf_id``, ``intf_label``,
         ``switch_label``, ``neighbor_label``.
     """
+    neighbor_set = set(neighbor_labels) if neighbor_labels else None
+    # Let the graph engine drop non-matching neighbors; the Python check
+    # below remains as a safety net.
+    label_filter = f"label={_qe_is_in(sorted(neighbor_set))}, " if neighbor_set else ""
     qe = (
         f"node('system', role='{local_role}', name='leaf')"
         ".out('hosted_interfaces')"
@@ -192,11 +307,11 @@ def find_interfaces_by_neighbor(
         ".in_('link')"
         ".node('interface')"
         ".in_('hosted_interfaces')"
-        f".node('system', system_type='{neighbor_system_type}', name='server')"
+        f".node('system', system_type='{neighbor_system_type}', "
+        f"{label_filter}name='server')"
     )
-    items = run_qe_query(client_factory, blueprint_id, qe)
+    items = iter_qe_query(client_factory, blueprint_id, qe)
 
-    neighbor_set = set(neighbor_labels) if neighbor_labels else None
     results = []
     for item in items:
         server = item.get("server", {})
@@ -228,24 +343,28 @@ def find_host_bond_interfaces(client_factory, blueprint_id, host_labels=None):
     Returns:
         dict: ``{host_label: interface_id}``
     """
-    qe = (
-        "node('system', system_type='server', name='server')"
-        ".out('hosted_interfaces')"
-        ".node('interface', if_type='port_channel', name='intf')"
-    )
-    items = run_qe_query(client_factory, blueprint_id, qe)
-
     host_set = set(host_labels) if host_labels else None
-    result = {}
-    for item in items:
-        server = item.get("server", {})
-        label = server.get("label")
-        if host_set and label not in host_set:
-            continue
-        intf = item.get("intf", {})
-        if label and intf.get("id"):
-            result[label] = intf["id"]
-    return result
+    items = iter_qe_query(client_factory, blueprint_id, _host_bonds_qe(host_set))
+    return _host_bonds_from_rows(items, host_set)
+
+
+def _host_bonds_qe(host_set):
+    """Build the host bond query, filtered to *host_set* when given."""
+    label_filter = f"label={_qe_is_in(sorted(host_set))}, " if host_set else ""
+    return _QE_HOST_BONDS.format(label_filter=label_filter)
+
+
+def _host_bonds_from_rows(items, host_set):
+    """Map host label to bond interface ID from host bond query rows."""
+    pairs = (
+        ((item.get("server") or {}).get("label"), (item.get("intf") or {}).get("id"))
+        for item in items
+    )
+    return {
+        label: intf_id
+        for label, intf_id in pairs
+        if label and intf_id and (not host_set or label in host_set)
+    }
 
 
 def find_host_evpn_interfaces(client_factory, blueprint_id, host_labels=None):
@@ -265,13 +384,23 @@ def find_host_evpn_interfaces(client_factory, blueprint_id, host_labels=None):
     Returns:
         dict: ``{host_label: evpn_interface_id}``
     """
-    qe = (
-        "node('interface', if_type='port_channel',"
-        " po_control_protocol='evpn', name='intf')"
+    host_set = set(host_labels) if host_labels else None
+    items = iter_qe_query(client_factory, blueprint_id, _host_evpn_qe(host_set))
+    return _host_evpn_from_rows(items, host_set)
+
+
+def _host_evpn_qe(host_set):
+    """Build the EVPN port-channel query, filtered to *host_set* when given."""
+    desc_filter = (
+        f" description={_qe_is_in(sorted('to.' + h for h in host_set))},"
+        if host_set
+        else ""
     )
-    items = run_qe_query(client_factory, blueprint_id, qe)
+    return _QE_EVPN_PORT_CHANNELS.format(desc_filter=desc_filter)
 
-    host_set = set(host_labels) if host_labels else None
+
+def _host_evpn_from_rows(items, host_set):
+    """Map host label to EVPN port-channel ID from EVPN query rows."""
     result = {}
     for item in items:
         intf = item.get("intf", {})
@@ -286,6 +415,39 @@ def find_host_evpn_interfaces(client_factory, blueprint_id, host_labels=None):
     return result
 
 
+def find_host_port_channels(client_factory, blueprint_id, host_labels=None):
+    """Find both bond and EVPN port-channel interfaces for host systems.
+
+    Combines ``find_host_bond_interfaces`` and
+    ``find_host_evpn_interfaces`` for callers that need both (mixed
+    single-homed / ESI-LAG fabrics).  The two queries traverse
+    different graph shapes, so they are sent concurrently with
+    ``run_qe_queries()`` — one round trip of wall-clock time instead
+    of two.
+
+    Args:
+        client_factory: ``ApstraClientFactory``.
+        blueprint_id: Blueprint UUID.
+        host_labels: Optional list of host labels to filter.
+
+    Returns:
+        dict: ``{host_label: {"bond": intf_id, "evpn": intf_id}}``.
+        A key is absent when the host has no interface of that kind.
+    """
+    host_set = set(host_labels) if host_labels else None
+    rows = run_qe_queries(
+        client_factory,
+        blueprint_id,
+        {"bond": _host_bonds_qe(host_set), "evpn": _host_evpn_qe(host_set)},
+    )
+    result = {}
+    for label, intf_id in _host_bonds_from_rows(rows["bond"], host_set).items():
+        result.setdefault(label, {})["bond"] = intf_id
+    for label, intf_id in _host_evpn_from_rows(rows["evpn"], host_set).items():
+        result.setdefault(label, {})["evpn"] = intf_id
+    return result
+
+
 def find_redundancy_groups(client_factory, blueprint_id):
     """Discover all ESI / MLAG redundancy groups and their member systems.
 
@@ -301,11 +463,7 @@ def find_redundancy_groups(client_factory, blueprint_id):
         where *members* is a **sorted** list of member system node IDs.
         Returns an empty dict when the blueprint has no redundancy groups.
     """
-    items = run_qe_query(
-        client_factory,
-        blueprint_id,
-        "node('redundancy_group', name='rg').out().node('system', name='mbr')",
-    )
+    items = run_qe_query(client_factory, blueprint_id, _QE_REDUNDANCY_GROUPS)
 
     rg_map = {}
     for item in items:
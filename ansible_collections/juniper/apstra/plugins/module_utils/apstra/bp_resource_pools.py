@@ -27,37 +27,57 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+from ansible_collections.juniper.apstra.plugins.module_utils.apstra.client import (
+    decode_json,
+)
+
+# Key for the resource-group list in the client factory's per-run cache
+_CACHE_KEY = "resource_groups"
+
 
 # ──────────────────────────────────────────────────────────────────
 #  Collection operations
 # ──────────────────────────────────────────────────────────────────
 
 
-def list_resource_groups(client_factory, blueprint_id):
+def list_resource_groups(client_factory, blueprint_id, use_cache=True):
     """List all resource groups in a blueprint.
 
     Calls ``GET /api/blueprints/{bp_id}/resource_groups`` via
-    ``raw_request``.
+    ``raw_request``.  The result is cached on the client factory for
+    the rest of the module run; ``update_resource_group`` invalidates
+    it.
 
     Args:
         client_factory: An ``ApstraClientFactory`` instance.
         blueprint_id: The blueprint UUID.
+        use_cache: Return the cached list when available (default
+            *True*).  Pass *False* to force a fresh GET.
 
     Returns:
         list[dict]: List of resource group dicts.  Returns empty list
         when no groups exist.
     """
+    if use_cache:
+        cached = client_factory.get_blueprint_cache(blueprint_id, _CACHE_KEY)
+        if cached is not None:
+            return list(cached)
     base = client_factory.get_base_client()
     resp = base.raw_request(f"/blueprints/{blueprint_id}/resource_groups")
     if resp.status_code == 200:
-        data = resp.json()
-        return data.get("items", [])
+        data = decode_json(resp)
+        items = data.get("items", [])
+        client_factory.set_blueprint_cache(blueprint_id, _CACHE_KEY, items)
+        return list(items)
     return []
 
 
 def get_resource_groups_by_type(client_factory, blueprint_id, resource_type):
     """Get resource groups filtered by type.
 
+    Filters the per-run cached ``list_resource_groups`` result, so
+    repeated lookups (for any type) cost one GET in total.
+
     Args:
         client_factory: An ``ApstraClientFactory`` instance.
         blueprint_id: The blueprint UUID.
@@ -96,7 +116,7 @@ def get_resource_group(client_factory, blueprint_id, resource_type, group_name):
         f"/blueprints/{blueprint_id}/resource_groups/{resource_type}/{group_name}"
     )
     if resp.status_code == 200:
-        return resp.json()
+        return decode_json(resp)
     return None
 
 
@@ -127,13 +147,15 @@ def update_resource_group(
         "PUT",
         data=data,
     )
+    client_factory.invalidate_blueprint_cache(blueprint_id, _CACHE_KEY)
     if resp.status_code not in (200, 202, 204):
         raise Exception(
             f"Failed to update resource group: {resp.status_code} {resp.text}"
         )
     try:
-        return resp.json()
-    except Exception:
+        return decode_json(resp)
+    except ValueError:
+        # 204 or other empty / non-JSON body
         return None
 
 
@@ -36,15 +36,57 @@ else:
     # Disable warnings about unverified HTTPS requests
     urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+try:
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+except ImportError as imp_exc:
+    REQUESTS_IMPORT_ERROR = imp_exc
+else:
+    REQUESTS_IMPORT_ERROR = None
+
+try:
+    import orjson
+except ImportError as imp_exc:
+    ORJSON_IMPORT_ERROR = imp_exc
+else:
+    ORJSON_IMPORT_ERROR = None
+
 import os
 import re
+import threading
 import time
 import yaml
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 DEFAULT_BLUEPRINT_LOCK_TIMEOUT = 60
 DEFAULT_BLUEPRINT_COMMIT_TIMEOUT = 30
 
+# Connection pool sizing for the SDK HTTP session.  Keep-alive
+# connections are reused across every raw_request / SDK call made by a
+# module run instead of paying a TCP+TLS handshake per request.
+DEFAULT_HTTP_POOL_CONNECTIONS = 4
+DEFAULT_HTTP_POOL_MAXSIZE = 32
+# Transient statuses retried (with backoff) for idempotent methods only
+_HTTP_RETRY_STATUSES = (429, 502, 503, 504)
+# Upper bound on concurrent requests issued by run_concurrently()
+DEFAULT_MAX_WORKERS = 8
+
+
+def decode_json(resp):
+    """
+    Decode a raw_request response body as JSON.
+    Uses orjson when it is installed (several times faster on large
+    configlet / QE payloads) and falls back to ``resp.json()``.
+    :param resp: A response returned by ``raw_request``.
+    :return: The decoded JSON value.
+    :raises ValueError: If the body is not valid JSON.
+    """
+    content = getattr(resp, "content", None)
+    if ORJSON_IMPORT_ERROR is None and content:
+        return orjson.loads(content)
+    return resp.json()
+
 
 def apstra_client_module_args():
     """
@@ -370,6 +412,8 @@ class ApstraClientFactory:
         username,
         password,
         logout,
+        pool_connections=DEFAULT_HTTP_POOL_CONNECTIONS,
+        pool_maxsize=DEFAULT_HTTP_POOL_MAXSIZE,
     ):
         self.module = module
         self.api_url = api_url
@@ -386,6 +430,16 @@ class ApstraClientFactory:
         self.tags_client = None
         self.resource_allocation_client = None
         self.virtual_infra_client = None
+        # HTTP adapter mounted on every SDK client's session (see
+        # _configure_http_pool).  Concurrent callers (run_concurrently)
+        # should keep max_workers at or below pool_maxsize, or surplus
+        # connections are discarded.
+        self._http_adapter = None
+        # Serialises lazy client creation and login; run_concurrently
+        # workers can request a client before any exists
+        self._client_lock = threading.Lock()
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
 
         # Map client members to client types
         self._client_types = {
@@ -461,6 +515,10 @@ class ApstraClientFactory:
         # Cache of blueprint design by id (e.g. 'freeform', 'two_stage_l3clos')
         self._blueprint_design = {}
 
+        # Per-run cache of read-only blueprint API results:
+        # {blueprint_id: {key: value}}
+        self._blueprint_cache = {}
+
     @classmethod
     def from_params(cls, module):
         """
@@ -511,18 +569,63 @@ class ApstraClientFactory:
                 "Missing required parameters: api_url, auth_token or (username and password)"
             )
 
+    def _configure_http_pool(self, client):
+        """
+        Mount the factory's pooled HTTP adapter on the client's own session.
+        The SDK client keeps its ``requests`` session object; only the
+        transport adapters for ``https://`` and ``http://`` are replaced,
+        through the public ``Session.mount()`` API.  One adapter instance
+        is shared by every SDK client, so they all reuse the same
+        keep-alive connection pool.
+        Retries: connection failures, and 429/502/503/504 responses to
+        idempotent methods (urllib3's default set: GET, HEAD, PUT,
+        DELETE, OPTIONS, TRACE), are retried up to 3 times with backoff
+        before the last response or error reaches the caller.  POST and
+        PATCH responses are never retried.
+        No-op when the client does not expose a ``requests`` session.
+        :param client: The SDK client instance.
+        """
+        if REQUESTS_IMPORT_ERROR is not None:
+            return
+        session = getattr(client, "session", None)
+        if session is None or not hasattr(session, "mount"):
+            return
+        if self._http_adapter is None:
+            retry = Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=_HTTP_RETRY_STATUSES,
+                raise_on_status=False,
+            )
+            self._http_adapter = HTTPAdapter(
+                pool_connections=self.pool_connections,
+                pool_maxsize=self.pool_maxsize,
+                max_retries=retry,
+            )
+        # Plain-HTTP api_url values (lab setups) get the same pooling
+        for prefix in ("https://", "http://"):
+            session.mount(prefix, self._http_adapter)
+
     def _get_client(self, client_attr, client_class):
         """
         Get the client instance for the given attribute.
+        The client is created and logged in once, then reused for the
+        lifetime of the factory.
         :param client_attr: The attribute name of the client.
         :param client_class: The class of the client.
         :return: The client instance.
         """
         client_instance = getattr(self, client_attr)
-        if client_instance is None:
-            client_instance = client_class(self.api_url, self.verify_certificates)
-            setattr(self, client_attr, client_instance)
-        self._login(client_instance)
+        if client_instance is not None:
+            return client_instance
+        with self._client_lock:
+            # Re-check: another thread may have created it meanwhile
+            client_instance = getattr(self, client_attr)
+            if client_instance is None:
+                client_instance = client_class(self.api_url, self.verify_certificates)
+                self._configure_http_pool(client_instance)
+                self._login(client_instance)
+                setattr(self, client_attr, client_instance)
         return client_instance
 
     # Regex for Apstra UUIDs (32 hex chars with hyphens: 8-4-4-4-12)
@@ -547,6 +650,67 @@ class ApstraClientFactory:
 
         return _resolve_bp(self, blueprint_ref)
 
+    def run_concurrently(self, func, items, max_workers=DEFAULT_MAX_WORKERS):
+        """
+        Call ``func(item)`` for each item using a bounded thread pool.
+        Independent API calls then overlap their round trips on the
+        shared connection pool instead of running one after another.
+        Like ``asyncio.gather(..., return_exceptions=True)``, an
+        exception raised for an item is returned in its slot rather
+        than raised.
+        :param func: Callable taking one item.
+        :param items: Iterable of items.
+        :param max_workers: Maximum number of concurrent calls.  Capped
+            at the factory's ``pool_maxsize`` so every worker gets a
+            pooled connection.
+        :return: List of results (or exceptions) in the order of items.
+        """
+        items = list(items)
+        max_workers = min(max_workers, self.pool_maxsize)
+
+        def _call(item):
+            try:
+                return func(item)
+            except Exception as e:
+                return e
+
+        if len(items) <= 1 or max_workers <= 1:
+            return [_call(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+            return list(executor.map(_call, items))
+
+    def get_blueprint_cache(self, blueprint_id, key):
+        """
+        Get a cached read-only API result for a blueprint.
+        The cached value is shared, not copied: callers must not mutate
+        it, and helpers that hand it to other code return a shallow copy.
+        :param blueprint_id: The blueprint ID.
+        :param key: The cache key (e.g. 'configlets').
+        :return: The cached value, or None if not cached.
+        """
+        return self._blueprint_cache.get(blueprint_id, {}).get(key)
+
+    def set_blueprint_cache(self, blueprint_id, key, value):
+        """
+        Cache a read-only API result for a blueprint for the rest of the run.
+        :param blueprint_id: The blueprint ID.
+        :param key: The cache key (e.g. 'configlets').
+        :param value: The value to cache.  It is stored as-is, so the
+            caller must not mutate it afterwards.
+        """
+        self._blueprint_cache.setdefault(blueprint_id, {})[key] = value
+
+    def invalidate_blueprint_cache(self, blueprint_id, key=None):
+        """
+        Drop cached API results for a blueprint after a mutation.
+        :param blueprint_id: The blueprint ID.
+        :param key: The cache key to drop, or None to drop all keys.
+        """
+        if key is None:
+            self._blueprint_cache.pop(blueprint_id, None)
+        else:
+            self._blueprint_cache.get(blueprint_id, {}).pop(key, None)
+
     def set_blueprint_design(self, blueprint_id, design):
         """
         Cache the design type for a blueprint.
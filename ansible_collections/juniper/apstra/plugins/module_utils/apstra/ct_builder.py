@@ -32,9 +32,17 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+try:
+    from aos.sdk.reference_design.extension.endpoint_policy import (
+        generator as ct_gen,
+    )
+except ImportError as imp_exc:
+    CT_GEN_IMPORT_ERROR = imp_exc
+else:
+    CT_GEN_IMPORT_ERROR = None
+
 from ansible_collections.juniper.apstra.plugins.module_utils.apstra.ct_primitives import (
-    PRIMITIVE_TYPES,
-    PLURAL_TO_SINGULAR,
+    PLURAL_TO_POLICY_TYPE,
 )
 
 
@@ -61,21 +69,7 @@ def build_ct_payload(name, primitives, description="", tags=None):
         ``obj_policy_import.put()``, *hierarchy* is the raw list
         of policy dicts (useful for extracting the CT ID).
     """
-    # Lazy import to avoid hard failure when aos_sdk is missing
-    from aos.sdk.reference_design.extension.endpoint_policy import (
-        generator as ct_gen,
-    )
-
-    sdk_policies = _primitives_dict_to_sdk(primitives)
-    hierarchy = ct_gen.create_ct_with_hierarchy(sdk_policies, name)
-
-    # Stamp description + tags on the visible batch node
-    for pol in hierarchy:
-        if pol.get("visible"):
-            pol["description"] = description or ""
-            pol["tags"] = tags or []
-
-    payload = ct_gen.wrap_policies(hierarchy)
+    payload, hierarchy, _ct_id = _build_ct_payload(name, primitives, description, tags)
     return payload, hierarchy
 
 
@@ -90,6 +84,40 @@ def get_ct_id_from_hierarchy(hierarchy):
 # ── Internal helpers ──────────────────────────────────────────────────
 
 
+def _build_ct_payload(name, primitives, description="", tags=None):
+    """
+    Build the payload like :func:`build_ct_payload`, also returning the
+    CT ID.
+
+    The ID of the visible (top-level batch) policy is noted in the same
+    pass that stamps description and tags on it, so callers do not need
+    a separate :func:`get_ct_id_from_hierarchy` scan.
+
+    Returns
+    -------
+    tuple(dict, list, str)
+        ``(payload, hierarchy, ct_id)``.
+    """
+    # aos_sdk is optional at import time; fail only when actually used
+    if CT_GEN_IMPORT_ERROR is not None:
+        raise CT_GEN_IMPORT_ERROR
+
+    sdk_policies = _primitives_dict_to_sdk(primitives)
+    hierarchy = ct_gen.create_ct_with_hierarchy(sdk_policies, name)
+
+    # Stamp description + tags on the visible batch node, noting its ID
+    ct_id = None
+    for pol in hierarchy:
+        if pol.get("visible"):
+            pol["description"] = description or ""
+            pol["tags"] = tags or []
+            if ct_id is None:
+                ct_id = pol["id"]
+
+    payload = ct_gen.wrap_policies(hierarchy)
+    return payload, hierarchy, ct_id
+
+
 def _primitives_dict_to_sdk(primitives):
     """
     Convert the Ansible dict-of-named-dicts format to the nested list
@@ -107,8 +135,7 @@ def _primitives_dict_to_sdk(primitives):
     """
     sdk_list = []
     for plural_key, instances in primitives.items():
-        singular = PLURAL_TO_SINGULAR[plural_key]
-        policy_type_name = PRIMITIVE_TYPES[singular]
+        singular, policy_type_name = PLURAL_TO_POLICY_TYPE[plural_key]
 
         for inst_name, inst_config in instances.items():
             attributes, children = _separate_attrs_and_children(
@@ -142,13 +169,15 @@ def _separate_attrs_and_children(config, singular=None):
     tuple(dict, dict)
         ``(attributes, children_dict)``
     """
-    attributes = {}
-    children = {}
-    for key, value in config.items():
-        if key in PLURAL_TO_SINGULAR:
-            children[key] = value
-        else:
-            attributes[key] = value
+    # Most primitives are leaves: find child keys with one C-level set
+    # intersection and only walk the config when there are any.
+    child_keys = config.keys() & PLURAL_TO_POLICY_TYPE.keys()
+    if child_keys:
+        attributes = {k: v for k, v in config.items() if k not in child_keys}
+        children = {k: v for k, v in config.items() if k in child_keys}
+    else:
+        attributes = dict(config)
+        children = {}
 
     # Translate interface_type alias for virtual_network_single
     if singular == "virtual_network_single" and "interface_type" in attributes:
@@ -50,10 +50,23 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 import json
+from itertools import islice
+
+try:
+    import orjson
+except ImportError as imp_exc:
+    ORJSON_IMPORT_ERROR = imp_exc
+else:
+    ORJSON_IMPORT_ERROR = None
 
 from ansible_collections.juniper.apstra.plugins.module_utils.apstra.ct_primitives import (
-    REVERSE_TYPES,
-    SINGULAR_TO_PLURAL,
+    POLICY_TYPE_TO_PLURAL,
+)
+
+# Policy attributes that wire up the hierarchy rather than describe the
+# primitive; dropped by _clean_attributes
+_INTERNAL_KEYS = frozenset(
+    {"subpolicies", "first_subpolicy", "second_subpolicy", "resolver"}
 )
 
 
@@ -76,15 +89,14 @@ def parse_ct_export(export_data):
     if not export_data:
         return None
 
-    # Build an ID → policy lookup
-    policy_map = {p["id"]: p for p in export_data}
-
-    # Find the visible batch (top-level CT)
+    # Build an ID → policy lookup and find the visible batch (top-level
+    # CT) in the same pass
+    policy_map = {}
     batch = None
     for p in export_data:
-        if p.get("visible") and p.get("policy_type_name") == "batch":
+        policy_map[p["id"]] = p
+        if batch is None and p.get("visible") and p.get("policy_type_name") == "batch":
             batch = p
-            break
 
     if batch is None:
         return None
@@ -116,8 +128,16 @@ def normalize_for_compare(primitives):
     str
         Deterministic JSON string.
     """
-    cleaned = _strip_and_sort(primitives)
-    return json.dumps(cleaned, sort_keys=True)
+    cleaned = _strip_nulls(primitives)
+    # Key ordering is left to the encoder; orjson sorts in native code
+    if ORJSON_IMPORT_ERROR is None:
+        try:
+            return orjson.dumps(
+                cleaned, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+            ).decode()
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits — let json handle it
+    return json.dumps(cleaned, sort_keys=True, separators=(",", ":"))
 
 
 # ── Internal helpers ──────────────────────────────────────────────────
@@ -127,58 +147,87 @@ def _parse_batch_children(batch, policy_map):
     """
     Walk the subpolicies of a *batch* node and return a primitives
     dict-of-named-dicts.
+
+    Nested batches are handled with an explicit stack instead of
+    recursion: each child batch is pushed together with the attribute
+    dict of the primitive that owns it, and its primitives are filled
+    into that dict when popped.  A batch shared by several pipelines is
+    parsed for each owner; only a batch that is its own ancestor (a
+    cycle) is skipped.
     """
+    plural_for_type = POLICY_TYPE_TO_PLURAL.get
     primitives = {}
+    stack = [(batch, primitives, frozenset((batch.get("id"),)))]
 
-    for pipeline_id in batch.get("attributes", {}).get("subpolicies", []):
-        pipeline = policy_map.get(pipeline_id)
-        if not pipeline or pipeline.get("policy_type_name") != "pipeline":
-            continue
+    while stack:
+        current, target, ancestors = stack.pop()
+        for pipeline_id in current.get("attributes", {}).get("subpolicies", []):
+            pipeline = policy_map.get(pipeline_id)
+            if not pipeline or pipeline.get("policy_type_name") != "pipeline":
+                continue
 
-        first_id = pipeline["attributes"].get("first_subpolicy")
-        second_id = pipeline["attributes"].get("second_subpolicy")
+            pipeline_attrs = pipeline.get("attributes") or {}
+            first_id = pipeline_attrs.get("first_subpolicy")
+            second_id = pipeline_attrs.get("second_subpolicy")
 
-        prim_policy = policy_map.get(first_id)
-        if not prim_policy:
-            continue
+            prim_policy = policy_map.get(first_id)
+            if not prim_policy:
+                continue
 
-        # Map policy_type_name → singular name → plural key
-        type_name = prim_policy.get("policy_type_name", "")
-        singular = REVERSE_TYPES.get(type_name)
-        if singular is None:
-            continue  # batch/pipeline — skip
-        plural = SINGULAR_TO_PLURAL.get(singular, singular)
+            # Map policy_type_name → plural key
+            plural = plural_for_type(prim_policy.get("policy_type_name", ""))
+            if plural is None:
+                continue  # batch/pipeline — skip
 
-        # Extract attributes (strip nulls and internal keys)
-        attrs = _clean_attributes(prim_policy.get("attributes", {}))
+            # Extract attributes (strip nulls and internal keys)
+            attrs = _clean_attributes(prim_policy.get("attributes", {}))
 
-        # Recurse into children (second_subpolicy is a child batch)
-        if second_id:
-            child_batch = policy_map.get(second_id)
-            if child_batch and child_batch.get("policy_type_name") == "batch":
-                child_prims = _parse_batch_children(child_batch, policy_map)
-                attrs.update(child_prims)
+            # Queue children (second_subpolicy is a child batch)
+            if second_id and second_id not in ancestors:
+                child_batch = policy_map.get(second_id)
+                if child_batch and child_batch.get("policy_type_name") == "batch":
+                    stack.append((child_batch, attrs, ancestors | {second_id}))
 
-        # Use the label as the instance key
-        inst_name = prim_policy.get("label", "unnamed")
+            # Use the label as the instance key
+            inst_name = prim_policy.get("label", "unnamed")
 
-        if plural not in primitives:
-            primitives[plural] = {}
-        primitives[plural][inst_name] = attrs
+            if plural not in target:
+                target[plural] = {}
+            target[plural][inst_name] = attrs
 
     return primitives
 
 
 def _clean_attributes(attrs):
     """Strip null values and internal keys from attributes."""
-    internal_keys = {"subpolicies", "first_subpolicy", "second_subpolicy", "resolver"}
-    return {k: v for k, v in attrs.items() if v is not None and k not in internal_keys}
+    return {k: v for k, v in attrs.items() if v is not None and k not in _INTERNAL_KEYS}
+
 
+def _strip_nulls(obj):
+    """Recursively strip null dict values for stable comparison.
 
-def _strip_and_sort(obj):
-    """Recursively strip nulls, sort dicts, for stable comparison."""
+    A container is only copied once a null or a changed child is seen;
+    clean subtrees are returned as-is.
+    """
     if isinstance(obj, dict):
-        return {k: _strip_and_sort(v) for k, v in sorted(obj.items()) if v is not None}
+        out = None
+        for i, (k, v) in enumerate(obj.items()):
+            new = None if v is None else _strip_nulls(v)
+            if out is None:
+                if v is not None and new is v:
+                    continue
+                out = dict(islice(obj.items(), i))
+            if v is not None:
+                out[k] = new
+        return obj if out is None else out
     if isinstance(obj, list):
-        return [_strip_and_sort(item) for item in obj]
+        out = None
+        for i, item in enumerate(obj):
+            new = _strip_nulls(item)
+            if out is None:
+                if new is item:
+                    continue
+                out = obj[:i]
+            out.append(new)
+        return obj if out is None else out
     return obj
@@ -52,6 +52,20 @@ PLURAL_TO_SINGULAR = {
 
 SINGULAR_TO_PLURAL = {v: k for k, v in PLURAL_TO_SINGULAR.items()}
 
+# Fused plural name → (singular name, policy_type_name), so the CT
+# builder resolves a primitive group with one lookup
+PLURAL_TO_POLICY_TYPE = {
+    plural: (singular, PRIMITIVE_TYPES[singular])
+    for plural, singular in PLURAL_TO_SINGULAR.items()
+}
+
+# Reverse of the above: policy_type_name → plural key, so the CT parser
+# maps an exported primitive with one lookup
+POLICY_TYPE_TO_PLURAL = {
+    policy_type: plural
+    for plural, (_singular, policy_type) in PLURAL_TO_POLICY_TYPE.items()
+}
+
 # ── CT types ─────────────────────────────────────────────────────────
 
 CT_TYPES = [
@@ -124,3 +138,19 @@ CHILD_PRIMITIVES = {
     ],
     "routing_zone_constraint": [],
 }
+
+# ── Precomputed lookups for the validator ────────────────────────────
+
+ALLOWED_PRIMITIVES_SET = {ct: frozenset(v) for ct, v in ALLOWED_PRIMITIVES.items()}
+CHILD_PRIMITIVES_SET = {p: frozenset(v) for p, v in CHILD_PRIMITIVES.items()}
+
+# Comma-joined, sorted plural key lists used in validation error messages
+VALID_PLURAL_KEYS_STR = ", ".join(sorted(PLURAL_TO_SINGULAR))
+ALLOWED_PLURAL_BY_CT = {
+    ct: ", ".join(sorted(SINGULAR_TO_PLURAL[s] for s in v))
+    for ct, v in ALLOWED_PRIMITIVES.items()
+}
+ALLOWED_CHILDREN_PLURAL_BY_TYPE = {
+    p: ", ".join(sorted(SINGULAR_TO_PLURAL[s] for s in v)) or "(none)"
+    for p, v in CHILD_PRIMITIVES.items()
+}
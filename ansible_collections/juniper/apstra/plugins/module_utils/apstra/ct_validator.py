@@ -18,8 +18,11 @@ __metaclass__ = type
 
 from ansible_collections.juniper.apstra.plugins.module_utils.apstra.ct_primitives import (
     PLURAL_TO_SINGULAR,
-    ALLOWED_PRIMITIVES,
-    CHILD_PRIMITIVES,
+    ALLOWED_PRIMITIVES_SET,
+    CHILD_PRIMITIVES_SET,
+    VALID_PLURAL_KEYS_STR,
+    ALLOWED_PLURAL_BY_CT,
+    ALLOWED_CHILDREN_PLURAL_BY_TYPE,
 )
 
 
@@ -61,21 +64,18 @@ def validate_primitives(ct_type, primitives):
             "primitives must be a dict keyed by plural primitive type name"
         )
 
-    allowed = ALLOWED_PRIMITIVES.get(ct_type, [])
+    allowed = ALLOWED_PRIMITIVES_SET.get(ct_type, frozenset())
 
     for plural_key, instances in primitives.items():
         singular = PLURAL_TO_SINGULAR.get(plural_key)
         if singular is None:
-            valid_keys = ", ".join(sorted(PLURAL_TO_SINGULAR.keys()))
             raise CTValidationError(
                 f"Unknown primitive type key '{plural_key}'. "
-                f"Valid keys: {valid_keys}"
+                f"Valid keys: {VALID_PLURAL_KEYS_STR}"
             )
 
         if singular not in allowed:
-            allowed_plural = ", ".join(
-                sorted(k for k, v in PLURAL_TO_SINGULAR.items() if v in allowed)
-            )
+            allowed_plural = ALLOWED_PLURAL_BY_CT.get(ct_type, "")
             raise CTValidationError(
                 f"Primitive '{plural_key}' is not allowed for CT type "
                 f"'{ct_type}'. Allowed top-level primitives: "
@@ -104,26 +104,18 @@ def _validate_children(parent_type, config, path):
     Recursively validate child primitives nested inside *config* for
     a primitive of *parent_type*.
     """
-    allowed_children = CHILD_PRIMITIVES.get(parent_type, [])
+    allowed_children = CHILD_PRIMITIVES_SET.get(parent_type, frozenset())
+    plural_to_singular = PLURAL_TO_SINGULAR.get
 
     for key, value in config.items():
-        child_singular = PLURAL_TO_SINGULAR.get(key)
+        child_singular = plural_to_singular(key)
         if child_singular is None:
             # Not a primitive type key — it's an attribute, skip
             continue
 
         # It is a primitive key — validate nesting
         if child_singular not in allowed_children:
-            allowed_keys = (
-                ", ".join(
-                    sorted(
-                        k
-                        for k, v in PLURAL_TO_SINGULAR.items()
-                        if v in allowed_children
-                    )
-                )
-                or "(none)"
-            )
+            allowed_keys = ALLOWED_CHILDREN_PLURAL_BY_TYPE.get(parent_type, "(none)")
             raise CTValidationError(
                 f"{path}: child primitive '{key}' is not allowed "
                 f"inside '{parent_type}'. Allowed children: "
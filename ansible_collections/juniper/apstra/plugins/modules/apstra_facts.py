@@ -221,6 +221,7 @@ def main():
         }
 
         # Split requested types into standard and special.
+        supported_objects = client_factory.network_objects_set
         requested_network_objects = []
         special_types = []
         for object_type in module.params["gather_network_facts"]:
@@ -229,7 +230,7 @@ def main():
                 break
             elif object_type in _SPECIAL_GATHER_TYPES:
                 special_types.append(object_type)
-            elif object_type in client_factory.network_objects_set:
+            elif object_type in supported_objects:
                 requested_network_objects.append(object_type)
             else:
                 module.fail_json(msg=f"Unsupported network object '{object_type}'")
@@ -1056,6 +1056,7 @@ def _handle_rack_added(module, client_factory, blueprint_id):
                 "rack_type_counts": {rack_type_id: racks_to_add},
             },
         )
+        client_factory.invalidate_blueprint_cache(blueprint_id)
         if resp.status_code not in (200, 201, 202):
             raise Exception(
                 f"Failed to add racks to blueprint: HTTP {resp.status_code} — {resp.text}"
@@ -1108,6 +1109,7 @@ def _handle_rack_added(module, client_factory, blueprint_id):
             "rack_type_counts": {rack_type_id: to_add},
         },
     )
+    client_factory.invalidate_blueprint_cache(blueprint_id)
     if resp.status_code not in (200, 201, 202):
         raise Exception(
             f"Failed to add racks to blueprint: HTTP {resp.status_code} — {resp.text}"
@@ -1158,6 +1160,7 @@ def _handle_rack_deleted(module, client_factory, blueprint_id):
         method="POST",
         data={"racks_to_delete": [resolved_id for _, resolved_id in resolved_ids]},
     )
+    client_factory.invalidate_blueprint_cache(blueprint_id)
     if resp.status_code not in (200, 201, 202, 204):
         raise Exception(
             f"Failed to delete racks: " f"HTTP {resp.status_code} — {resp.text}"
@@ -733,8 +733,7 @@ from ansible_collections.juniper.apstra.plugins.module_utils.apstra.ct_validator
     CTValidationError,
 )
 from ansible_collections.juniper.apstra.plugins.module_utils.apstra.ct_builder import (
-    build_ct_payload,
-    get_ct_id_from_hierarchy,
+    _build_ct_payload,
 )
 from ansible_collections.juniper.apstra.plugins.module_utils.apstra.ct_parser import (
     parse_ct_export,
@@ -1018,14 +1017,12 @@ def main():
                     # Delete old CT and recreate (atomic replace)
                     ep_client.blueprints[blueprint_id].endpoint_policies[ct_id].delete()
 
-                    payload, hierarchy = build_ct_payload(
+                    payload, hierarchy, ct_id = _build_ct_payload(
                         ct_name, primitives, description, tags
                     )
                     ep_client.blueprints[blueprint_id].obj_policy_import.put(payload)
                     _refresh_rp_bindings(ep_client, blueprint_id, hierarchy)
 
-                    ct_id = get_ct_id_from_hierarchy(hierarchy)
-
                     # Restore assignments to the new CT
                     if saved_app_points:
                         _reassign_ct(ep_client, blueprint_id, ct_id, saved_app_points)
@@ -1039,13 +1036,11 @@ def main():
                     )
             else:
                 # ── Create path ───────────────────────────────────────
-                payload, hierarchy = build_ct_payload(
+                payload, hierarchy, ct_id = _build_ct_payload(
                     ct_name, primitives, description, tags
                 )
                 ep_client.blueprints[blueprint_id].obj_policy_import.put(payload)
                 _refresh_rp_bindings(ep_client, blueprint_id, hierarchy)
-
-                ct_id = get_ct_id_from_hierarchy(hierarchy)
                 result["changed"] = True
                 result["msg"] = "connectivity_template created successfully"
 
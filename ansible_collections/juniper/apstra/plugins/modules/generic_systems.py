@@ -444,8 +444,6 @@ from ansible_collections.juniper.apstra.plugins.module_utils.apstra.name_resolut
 from ansible_collections.juniper.apstra.plugins.module_utils.apstra.bp_nodes import (
     get_node as get_blueprint_node,
     patch_node,
-    set_node_tags as set_blueprint_node_tags,
-    set_node_property as set_blueprint_node_property,
 )
 
 # SDK-based helpers (QE graph queries)
@@ -471,29 +469,91 @@ from ansible_collections.juniper.apstra.plugins.module_utils.apstra.bp_generic_s
 #  SDK-based system discovery helpers  (QE queries + node reads)
 # ──────────────────────────────────────────────────────────────────
 
+# QE query templates.  Values are passed as run_qe_query() params, which
+# quotes them, so labels containing quotes cannot break the query.
+_QE_SYSTEM_BY = {
+    prop: "node('system', system_type='server', " + prop + "={value}, name='gs')"
+    for prop in ("label", "hostname")
+}
+# Traversal from a matched 'gs' system node to its ethernet links and
+# the system at the far end of each
+_QE_LINKS_DETAIL_TAIL = (
+    ".out('hosted_interfaces').node('interface', name='gs_intf')"
+    ".out('link').node('link', link_type='ethernet', name='link')"
+    ".in_('link').node('interface', name='sw_intf')"
+    ".in_('hosted_interfaces').node('system', name='switch')"
+)
+# Every link on a system's interfaces, whatever its type or far end;
+# used to collect the link IDs to delete
+_QE_SYSTEM_LINK_IDS = (
+    "node('system', id={sys_id}, name='gs')"
+    ".out('hosted_interfaces').node('interface', name='intf')"
+    ".out('link').node('link', name='link')"
+)
+_QE_SYSTEM_LINKS_DETAIL = (
+    "node('system', id={sys_id}, name='gs')" + _QE_LINKS_DETAIL_TAIL
+)
+_QE_SYSTEM_WITH_LINKS = {
+    prop: query + _QE_LINKS_DETAIL_TAIL for prop, query in _QE_SYSTEM_BY.items()
+}
+# Key template for a system's link-traversal rows in the client
+# factory's per-run cache.  The link and system writers in
+# bp_generic_systems invalidate the whole blueprint cache.
+_LINK_ROWS_CACHE_KEY = "system_links:{}"
+# Maximum application points cleared per obj-policy-export request
+_CT_CLEAR_BATCH_SIZE = 64
+# Concurrent obj-policy-export requests; kept below the client's HTTP
+# pool size (DEFAULT_HTTP_POOL_MAXSIZE) so no connection is discarded
+_CT_CLEAR_MAX_WORKERS = 16
+# Ethernet interfaces of a system; each is a potential CT application
+# point cleared before the system's links are removed
+_QE_SYSTEM_ETHERNET_INTERFACES = (
+    "node('system', id={sys_id}, name='gs')"
+    ".out('hosted_interfaces')"
+    ".node('interface', if_type='ethernet', name='intf')"
+)
 
-def find_system_by_label(client_factory, blueprint_id, label):
-    """Find a generic system by label using QE."""
+
+def _find_system(client_factory, blueprint_id, prop, value):
+    """Find a generic system whose *prop* equals *value* using QE."""
     items = run_qe_query(
         client_factory,
         blueprint_id,
-        f"node('system', system_type='server', label='{label}', name='gs')",
+        _QE_SYSTEM_BY[prop],
+        params={"value": value},
     )
     if items:
         return items[0].get("gs", items[0])
     return None
 
 
+def find_system_by_label(client_factory, blueprint_id, label):
+    """Find a generic system by label using QE."""
+    return _find_system(client_factory, blueprint_id, "label", label)
+
+
 def find_system_by_hostname(client_factory, blueprint_id, hostname):
     """Find a generic system by hostname using QE."""
-    items = run_qe_query(
-        client_factory,
-        blueprint_id,
-        f"node('system', system_type='server', hostname='{hostname}', name='gs')",
-    )
-    if items:
-        return items[0].get("gs", items[0])
-    return None
+    return _find_system(client_factory, blueprint_id, "hostname", hostname)
+
+
+def _system_link_rows(client_factory, blueprint_id, sys_id):
+    """Return the link-detail QE rows for a system.
+
+    The rows are cached per system for the rest of the module run, so
+    repeated link-detail reads share one query.
+    """
+    key = _LINK_ROWS_CACHE_KEY.format(sys_id)
+    items = client_factory.get_blueprint_cache(blueprint_id, key)
+    if items is None:
+        items = run_qe_query(
+            client_factory,
+            blueprint_id,
+            _QE_SYSTEM_LINKS_DETAIL,
+            params={"sys_id": sys_id},
+        )
+        client_factory.set_blueprint_cache(blueprint_id, key, items)
+    return items
 
 
 def get_system_link_ids(client_factory, blueprint_id, sys_id):
@@ -501,97 +561,196 @@ def get_system_link_ids(client_factory, blueprint_id, sys_id):
     items = run_qe_query(
         client_factory,
         blueprint_id,
-        (
-            f"node('system', id='{sys_id}', name='gs')"
-            f".out('hosted_interfaces').node('interface', name='intf')"
-            f".out('link').node('link', name='link')"
-        ),
+        _QE_SYSTEM_LINK_IDS,
+        params={"sys_id": sys_id},
+    )
+    return _link_ids_from_rows(items)
+
+
+def _link_ids_from_rows(items):
+    """Collect non-aggregate link IDs from link-ID QE rows, deduplicated."""
+    links = (item.get("link") or {} for item in items)
+    return list(
+        dict.fromkeys(
+            link["id"]
+            for link in links
+            if link.get("id") and link.get("link_type") != "aggregate_link"
+        )
     )
-    link_ids = set()
-    for item in items:
-        if isinstance(item, dict):
-            link_info = item.get("link", {})
-            if isinstance(link_info, dict) and link_info.get("id"):
-                if link_info.get("link_type") != "aggregate_link":
-                    link_ids.add(link_info["id"])
-    return list(link_ids)
 
 
 def get_system_links_detail(client_factory, blueprint_id, sys_id):
     """Get detailed link+interface info for a system via QE."""
+    items = _system_link_rows(client_factory, blueprint_id, sys_id)
+    return _links_from_rows(items, sys_id)
+
+
+def get_system_bundle(client_factory, blueprint_id, sys_id):
+    """Read a system node and its link IDs with a single QE query.
+
+    Replaces a node read plus a separate ``get_system_link_ids`` query
+    for callers that need both.  The link IDs use the same predicate as
+    ``get_system_link_ids`` (every link except ``aggregate_link``), so
+    none are missed on deletion.  A system without links does not match
+    the link traversal, so its node is read on its own.
+
+    Returns:
+        dict: ``system`` (node dict, or *None* if the system does not
+        exist) and ``link_ids``.
+    """
     items = run_qe_query(
         client_factory,
         blueprint_id,
-        (
-            f"node('system', id='{sys_id}', name='gs')"
-            f".out('hosted_interfaces').node('interface', name='gs_intf')"
-            f".out('link').node('link', link_type='ethernet', name='link')"
-            f".in_('link').node('interface', name='sw_intf')"
-            f".in_('hosted_interfaces').node('system', name='switch')"
-        ),
+        _QE_SYSTEM_LINK_IDS,
+        params={"sys_id": sys_id},
+    )
+    if items:
+        system = items[0].get("gs") or None
+    else:
+        system = get_blueprint_node(client_factory, blueprint_id, sys_id)
+    return {"system": system, "link_ids": _link_ids_from_rows(items)}
+
+
+def find_system_with_links(client_factory, blueprint_id, label=None, hostname=None):
+    """Find a generic system by label or hostname together with its links.
+
+    Resolves the system and enumerates its links in one QE round trip
+    instead of ``find_system_by_*`` followed by
+    ``get_system_links_detail``.  A system without links does not
+    match the combined traversal, so it is looked up on its own and
+    its links are returned as an empty list.
+
+    Returns:
+        tuple: ``(system, links)``.  *system* is *None* when no system
+        matches; *links* has the ``get_system_links_detail`` row shape.
+    """
+    if label:
+        prop, value = "label", label
+    else:
+        prop, value = "hostname", hostname
+    items = run_qe_query(
+        client_factory,
+        blueprint_id,
+        _QE_SYSTEM_WITH_LINKS[prop],
+        params={"value": value},
     )
-    links = []
-    seen_link_ids = set()
+    if items:
+        system = items[0].get("gs", {})
+        sys_id = system.get("id")
+        # Several systems can share a label or hostname; keep only the
+        # rows of the system being returned
+        items = [item for item in items if (item.get("gs") or {}).get("id") == sys_id]
+        client_factory.set_blueprint_cache(
+            blueprint_id, _LINK_ROWS_CACHE_KEY.format(sys_id), items
+        )
+        return system, _links_from_rows(items, sys_id)
+
+    system = _find_system(client_factory, blueprint_id, prop, value)
+    return system, ([] if system else None)
+
+
+def _links_from_rows(items, sys_id):
+    """Build deduplicated link-detail dicts from link-traversal QE rows.
+
+    Rows belonging to a system other than *sys_id* are ignored.
+    """
+    # Keyed by link ID: one hash probe per row dedups, and insertion
+    # order keeps the QE row order.
+    links_by_id = {}
     for item in items:
-        if not isinstance(item, dict):
-            continue
-        link = item.get("link", {})
-        sw = item.get("switch", {})
-        sw_intf = item.get("sw_intf", {})
-        if sw.get("id") == sys_id:
+        if (item.get("gs") or {}).get("id") != sys_id:
             continue
+        link = item.get("link") or {}
         lid = link.get("id")
-        if lid in seen_link_ids:
+        if lid is None or lid in links_by_id:
             continue
-        seen_link_ids.add(lid)
-        links.append(
-            {
-                "link_id": lid,
-                "target_switch_id": sw.get("id"),
-                "target_switch_if_name": sw_intf.get("if_name"),
-                "lag_mode": link.get("lag_mode"),
-                "group_label": link.get("group_label"),
-                "tags": link.get("tags", []) or [],
-            }
-        )
-    return links
+        sw = item.get("switch") or {}
+        if sw.get("id") == sys_id:
+            continue
+        links_by_id[lid] = {
+            "link_id": lid,
+            "target_switch_id": sw.get("id"),
+            "target_switch_if_name": (item.get("sw_intf") or {}).get("if_name"),
+            "lag_mode": link.get("lag_mode"),
+            "group_label": link.get("group_label"),
+            "tags": link.get("tags", []) or [],
+        }
+    return list(links_by_id.values())
 
 
 def clear_cts_from_links(client_factory, blueprint_id, sys_id):
     """Clear all connectivity templates from a system's link interfaces.
 
-    Uses QE (SDK) to discover interfaces, then raw_request for the
-    obj-policy-export endpoint.
+    Uses QE (SDK) to discover the system's ethernet interfaces, then
+    raw_request for the obj-policy-export endpoint.  Interfaces are
+    cleared in batches of up to ``_CT_CLEAR_BATCH_SIZE`` per request.
+
+    Clearing is best-effort: failures are logged via ``module.debug``
+    instead of failing the task.  These are POSTs, which the client's
+    HTTP adapter does not retry on error statuses.
     """
     items = run_qe_query(
         client_factory,
         blueprint_id,
-        (
-            f"node('system', id='{sys_id}', name='gs')"
-            f".out('hosted_interfaces')"
-            f".node('interface', if_type='ethernet', name='intf')"
-        ),
+        _QE_SYSTEM_ETHERNET_INTERFACES,
+        params={"sys_id": sys_id},
     )
-    intf_ids = []
-    for item in items:
-        if isinstance(item, dict):
-            intf = item.get("intf", {})
-            if isinstance(intf, dict) and intf.get("id"):
-                intf_ids.append(intf["id"])
+    # dict.fromkeys dedups in one ordered pass
+    intfs = (item.get("intf") or {} for item in items)
+    intf_ids = list(dict.fromkeys(intf["id"] for intf in intfs if intf.get("id")))
 
     if not intf_ids:
         return
 
-    for intf_id in intf_ids:
-        try:
-            base = client_factory.get_base_client()
-            base.raw_request(
-                f"/blueprints/{blueprint_id}/obj-policy-export",
-                "POST",
-                data={"policy_type_name": "", "application_points": [intf_id]},
+    module = client_factory.module
+    ok_codes = (200, 201, 202, 204)
+    base = client_factory.get_base_client()
+    path = f"/blueprints/{blueprint_id}/obj-policy-export"
+
+    def _clear(app_points):
+        return base.raw_request(
+            path,
+            "POST",
+            data={"policy_type_name": "", "application_points": app_points},
+        )
+
+    # obj-policy-export accepts a list of application points, so clear
+    # up to _CT_CLEAR_BATCH_SIZE interfaces per round trip; batches are
+    # sent concurrently.  Interfaces of a rejected batch are retried
+    # one call each.
+    batches = [
+        intf_ids[i : i + _CT_CLEAR_BATCH_SIZE]
+        for i in range(0, len(intf_ids), _CT_CLEAR_BATCH_SIZE)
+    ]
+    results = client_factory.run_concurrently(
+        _clear, batches, max_workers=_CT_CLEAR_MAX_WORKERS
+    )
+    retry_ids = []
+    for batch, resp in zip(batches, results):
+        if isinstance(resp, Exception):
+            module.debug(f"Batched CT clear failed: {resp}; retrying per interface")
+        elif resp.status_code in ok_codes:
+            continue
+        else:
+            module.debug(
+                f"Batched CT clear rejected: {resp.status_code} {resp.text}; "
+                "retrying per interface"
+            )
+        retry_ids.extend(batch)
+
+    results = client_factory.run_concurrently(
+        lambda intf_id: _clear([intf_id]),
+        retry_ids,
+        max_workers=_CT_CLEAR_MAX_WORKERS,
+    )
+    for intf_id, resp in zip(retry_ids, results):
+        if isinstance(resp, Exception):
+            module.debug(f"Clearing CTs from interface {intf_id} failed: {resp}")
+        elif resp.status_code not in ok_codes:
+            module.debug(
+                f"Clearing CTs from interface {intf_id} failed: "
+                f"{resp.status_code} {resp.text}"
             )
-        except Exception:
-            pass  # Best-effort CT clearing
 
 
 # ──────────────────────────────────────────────────────────────────
@@ -771,12 +930,20 @@ def _handle_present(module, client_factory):
 
     # ── Try to find existing system ───────────────────────────────
     existing = None
+    current_links = None
     if sys_id:
         existing = get_blueprint_node(client_factory, bp_id, sys_id)
         if existing is None:
             raise ValueError(
                 f"Generic system '{sys_id}' not found in blueprint '{bp_id}'"
             )
+    elif links and (name or hostname):
+        # Resolve the system and its current links in one QE query
+        existing, current_links = find_system_with_links(
+            client_factory, bp_id, label=name, hostname=hostname
+        )
+        if existing:
+            sys_id = existing["id"]
     elif name:
         existing = find_system_by_label(client_factory, bp_id, name)
         if existing:
@@ -805,6 +972,7 @@ def _handle_present(module, client_factory):
             port_channel_id_min,
             port_channel_id_max,
             is_external,
+            current_links=current_links,
         )
     else:
         # ── CREATE path ───────────────────────────────────────────
@@ -1027,8 +1195,13 @@ def _handle_update(
     port_channel_id_min,
     port_channel_id_max,
     is_external=None,
+    current_links=None,
 ):
-    """Update an existing generic system."""
+    """Update an existing generic system.
+
+    *current_links* may carry the system's links when the caller has
+    already read them; otherwise they are queried when needed.
+    """
     changed = False
     changes = {}
 
@@ -1044,26 +1217,34 @@ def _handle_update(
         patch_body["deploy_mode"] = deploy_mode
         changes["deploy_mode"] = {"old": current.get("deploy_mode"), "new": deploy_mode}
 
-    if patch_body:
-        patch_node(client_factory, bp_id, sys_id, patch_body)
-        changed = True
-
     # ── Update external flag (requires allow_unsafe) ──────────────
     if is_external is not None:
         current_external = current.get("external", False)
         if current_external != is_external:
-            set_blueprint_node_property(
-                client_factory, bp_id, sys_id, "external", is_external
-            )
+            patch_body["external"] = is_external
             changes["external"] = {"old": current_external, "new": is_external}
-            changed = True
 
     # ── Update tags ───────────────────────────────────────────────
     current_tags = sorted(current.get("tags", []) or [])
     desired_tags = sorted(tags) if tags else []
     if tags is not None and current_tags != desired_tags:
-        set_blueprint_node_tags(client_factory, bp_id, sys_id, tags)
+        patch_body["tags"] = tags
         changes["tags"] = {"old": current_tags, "new": desired_tags}
+
+    # ── Update port-channel ID range ──────────────────────────────
+    cur_pc_min = current.get("port_channel_id_min", 0) or 0
+    cur_pc_max = current.get("port_channel_id_max", 0) or 0
+    if port_channel_id_min is not None and cur_pc_min != port_channel_id_min:
+        patch_body["port_channel_id_min"] = port_channel_id_min
+        changes["port_channel_id_min"] = {"old": cur_pc_min, "new": port_channel_id_min}
+    if port_channel_id_max is not None and cur_pc_max != port_channel_id_max:
+        patch_body["port_channel_id_max"] = port_channel_id_max
+        changes["port_channel_id_max"] = {"old": cur_pc_max, "new": port_channel_id_max}
+
+    # Safe and unsafe fields share one PATCH; patch_node sets
+    # allow_unsafe when any unsafe field is present.
+    if patch_body:
+        patch_node(client_factory, bp_id, sys_id, patch_body)
         changed = True
 
     # ── Update ASN (via domain node graph mutation) ─────────────────
@@ -1098,25 +1279,11 @@ def _handle_update(
             changes["loopback_ipv6"] = {"old": current_lo6, "new": loopback_ipv6}
         changed = True
 
-    # ── Update port-channel ID range ──────────────────────────────
-    cur_pc_min = current.get("port_channel_id_min", 0) or 0
-    cur_pc_max = current.get("port_channel_id_max", 0) or 0
-    if port_channel_id_min is not None and cur_pc_min != port_channel_id_min:
-        set_blueprint_node_property(
-            client_factory, bp_id, sys_id, "port_channel_id_min", port_channel_id_min
-        )
-        changes["port_channel_id_min"] = {"old": cur_pc_min, "new": port_channel_id_min}
-        changed = True
-    if port_channel_id_max is not None and cur_pc_max != port_channel_id_max:
-        set_blueprint_node_property(
-            client_factory, bp_id, sys_id, "port_channel_id_max", port_channel_id_max
-        )
-        changes["port_channel_id_max"] = {"old": cur_pc_max, "new": port_channel_id_max}
-        changed = True
-
     # ── Update links (diff-based) ─────────────────────────────────
     if links:
-        link_changes = _update_link_set(client_factory, bp_id, sys_id, links)
+        link_changes = _update_link_set(
+            client_factory, bp_id, sys_id, links, current_links
+        )
         if link_changes:
             changes["links"] = link_changes
             changed = True
@@ -1158,12 +1325,15 @@ def _handle_update(
         )
 
 
-def _update_link_set(client_factory, bp_id, sys_id, desired_links):
+def _update_link_set(client_factory, bp_id, sys_id, desired_links, current_links=None):
     """Diff desired vs current links and apply add/delete operations.
 
+    *current_links* is queried when not supplied by the caller.
+
     Returns a changes dict or None if no changes.
     """
-    current_links = get_system_links_detail(client_factory, bp_id, sys_id)
+    if current_links is None:
+        current_links = get_system_links_detail(client_factory, bp_id, sys_id)
 
     # Build digest maps
     current_by_digest = {_current_link_digest(cl): cl for cl in current_links}
@@ -1212,27 +1382,23 @@ def _apply_properties(
 ):
     """Apply all system-level properties after creation.
 
-    Safe properties (deploy_mode) go through normal PATCH.
-    Tags and port-channel go through allow_unsafe PATCH.
+    Node properties (deploy_mode, tags, port-channel range) go out in
+    one node PATCH, with allow_unsafe set when needed.
     ASN and loopback use graph-mutation APIs (domain node / interface node).
     """
-    # Safe properties (normal node PATCH)
-    safe_patch = {}
+    # Node properties go out in a single PATCH; patch_node sets
+    # allow_unsafe when any unsafe field is present.
+    node_patch = {}
     if deploy_mode and deploy_mode != "deploy":
-        safe_patch["deploy_mode"] = deploy_mode
-    if safe_patch:
-        patch_node(client_factory, bp_id, sys_id, safe_patch)
-
-    # Unsafe node properties (require allow_unsafe=true)
-    unsafe_patch = {}
+        node_patch["deploy_mode"] = deploy_mode
     if tags:
-        unsafe_patch["tags"] = tags
+        node_patch["tags"] = tags
     if port_channel_id_min:
-        unsafe_patch["port_channel_id_min"] = port_channel_id_min
+        node_patch["port_channel_id_min"] = port_channel_id_min
     if port_channel_id_max:
-        unsafe_patch["port_channel_id_max"] = port_channel_id_max
-    if unsafe_patch:
-        patch_node(client_factory, bp_id, sys_id, unsafe_patch)
+        node_patch["port_channel_id_max"] = port_channel_id_max
+    if node_patch:
+        patch_node(client_factory, bp_id, sys_id, node_patch)
 
     # ASN via graph-mutation (domain node)
     if asn is not None:
@@ -1284,8 +1450,9 @@ def _handle_absent(module, client_factory):
             "generic system does not exist",
         )
 
-    # Check if system still exists
-    current = get_blueprint_node(client_factory, bp_id, sys_id)
+    # Check if system still exists; its link IDs come back in the same query
+    bundle = get_system_bundle(client_factory, bp_id, sys_id)
+    current = bundle["system"]
     if current is None:
         return _build_result(
             client_factory,
@@ -1310,7 +1477,7 @@ def _handle_absent(module, client_factory):
     if is_external:
         # Remove links first — Apstra requires links to be removed
         # before deleting an external generic system.
-        link_ids = get_system_link_ids(client_factory, bp_id, sys_id)
+        link_ids = bundle["link_ids"]
         if link_ids:
             try:
                 delete_switch_system_links(client_factory, bp_id, link_ids)
@@ -1329,7 +1496,7 @@ def _handle_absent(module, client_factory):
             "external generic system deleted successfully",
         )
     else:
-        link_ids = get_system_link_ids(client_factory, bp_id, sys_id)
+        link_ids = bundle["link_ids"]
         if link_ids:
             delete_switch_system_links(client_factory, bp_id, link_ids)
             return _build_result(
@@ -324,18 +324,21 @@ from ansible_collections.juniper.apstra.plugins.module_utils.apstra.name_resolut
 
 
 def _reimport_blueprint_property_set(
-    client_factory, id, body, result, leaf_object_type
+    client_factory, id, body, result, leaf_object_type, current_object=None
 ):
     """Reimport (PUT) a property set into a blueprint.
 
     Delegates to the shared utility in ``module_utils.apstra.bp_property_set``
     which handles the ``raw_request`` PUT (SDK has no ``.update()`` for
-    blueprint property-set resources).
+    blueprint property-set resources).  *current_object*, when given,
+    is the blueprint copy already read and saves the "before" GET.
     """
     bp_id = id["blueprint"]
     ps_id = id[leaf_object_type]
 
-    outcome = reimport_blueprint_property_set(client_factory, bp_id, ps_id, body)
+    outcome = reimport_blueprint_property_set(
+        client_factory, bp_id, ps_id, body, before=current_object
+    )
     result["changed"] = outcome["changed"]
     result["msg"] = outcome["msg"]
     result["id"] = id
@@ -493,7 +496,12 @@ def _handle_blueprint_property_set(module, client_factory, id, body, state, resu
                     # The SDK freeform client has no .update() (PUT)
                     # on blueprint property_sets, so use raw_request.
                     _reimport_blueprint_property_set(
-                        client_factory, id, body, result, leaf_object_type
+                        client_factory,
+                        id,
+                        body,
+                        result,
+                        leaf_object_type,
+                        current_object=current_object,
                     )
                 else:
                     # Partial update via PATCH